@@ -0,0 +1,38 @@
+"""Add unique index on workouts.garmin_activity_id
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = 'ix_workouts_garmin_activity_id'
+
+
+def upgrade() -> None:
+    """Index Garmin activity IDs for existence checks during sync."""
+    inspector = sa.inspect(op.get_bind())
+    if 'workouts' not in inspector.get_table_names():
+        # Table is created by init_db with the index already in place
+        return
+    existing = {index['name'] for index in inspector.get_indexes('workouts')}
+    if INDEX_NAME not in existing:
+        op.create_index(INDEX_NAME, 'workouts', ['garmin_activity_id'], unique=True)
+
+
+def downgrade() -> None:
+    """Drop the Garmin activity ID index."""
+    inspector = sa.inspect(op.get_bind())
+    if 'workouts' not in inspector.get_table_names():
+        return
+    existing = {index['name'] for index in inspector.get_indexes('workouts')}
+    if INDEX_NAME in existing:
+        op.drop_index(INDEX_NAME, table_name='workouts')
@@ -0,0 +1,41 @@
+"""Generate created_at/updated_at timestamps in the database
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+TIMESTAMPED_TABLES = [
+    'analyses', 'garmin_sync_log', 'plans', 'prompts', 'routes',
+    'rules', 'sections', 'users', 'workouts',
+]
+
+
+def _existing_tables():
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+    return [table for table in TIMESTAMPED_TABLES if table in existing]
+
+
+def upgrade() -> None:
+    """Add CURRENT_TIMESTAMP server defaults to the BaseModel timestamp columns."""
+    for table in _existing_tables():
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column('created_at', existing_type=sa.DateTime(), server_default=sa.func.now())
+            batch_op.alter_column('updated_at', existing_type=sa.DateTime(), server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    """Remove the timestamp server defaults."""
+    for table in _existing_tables():
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column('created_at', existing_type=sa.DateTime(), server_default=None)
+            batch_op.alter_column('updated_at', existing_type=sa.DateTime(), server_default=None)
@@ -0,0 +1,38 @@
+"""Add descending index on workouts.start_time
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-15 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = 'ix_workouts_start_time'
+
+
+def upgrade() -> None:
+    """Index start times so newest-first workout lists avoid a full sort."""
+    inspector = sa.inspect(op.get_bind())
+    if 'workouts' not in inspector.get_table_names():
+        # Table is created by init_db with the index already in place
+        return
+    existing = {index['name'] for index in inspector.get_indexes('workouts')}
+    if INDEX_NAME not in existing:
+        op.create_index(INDEX_NAME, 'workouts', [sa.text('start_time DESC')])
+
+
+def downgrade() -> None:
+    """Drop the start time index."""
+    inspector = sa.inspect(op.get_bind())
+    if 'workouts' not in inspector.get_table_names():
+        return
+    existing = {index['name'] for index in inspector.get_indexes('workouts')}
+    if INDEX_NAME in existing:
+        op.drop_index(INDEX_NAME, table_name='workouts')
@@ -1,24 +1,41 @@
 import os
+import orjson
 from pathlib import Path
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import declarative_base
 
-# Use SQLite database in data directory
-DATA_DIR = Path("data")
+# Use SQLite database in data directory. It is anchored to the project root
+# (or set by DATA_DIR) so the CLI, TUI and API share it wherever they start.
+DATA_DIR = Path(os.getenv("DATA_DIR", Path(__file__).resolve().parents[2] / "data"))
 DATABASE_PATH = DATA_DIR / "cycling_coach.db"
 DATABASE_URL = os.getenv("DATABASE_URL", f"sqlite+aiosqlite:///{DATABASE_PATH}")
 
+# Size the connection pool for server databases; aiosqlite does not use a sized pool.
+# Local SQLite connections never go stale, so only server connections are pinged on checkout.
+POOL_OPTIONS = {} if "sqlite" in DATABASE_URL else {"pool_size": 20, "max_overflow": 10, "pool_pre_ping": True}
+
+def json_serializer(obj) -> str:
+    """Serialize JSON columns with orjson; the drivers expect text, not bytes."""
+    return orjson.dumps(obj).decode()
+
+# Passed to every engine so JSON columns such as Workout.metrics skip stdlib json
+JSON_OPTIONS = {"json_serializer": json_serializer, "json_deserializer": orjson.loads}
+
 engine = create_async_engine(
     DATABASE_URL,
     echo=False,  # Set to True for SQL debugging
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
+    **JSON_OPTIONS,
+    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {},
+    **POOL_OPTIONS
 )
 
-AsyncSessionLocal = sessionmaker(
-    bind=engine,
-    class_=AsyncSession,
-    expire_on_commit=False
-)
+AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False)
+
+# Stored in SQLite's user_version once init_db has created the schema. Bump it
+# when models gain tables so existing databases get them. create_all never
+# alters existing tables, so new indexes, columns and defaults need an alembic
+# migration instead (see "Upgrading an existing database" in the README).
+SCHEMA_VERSION = 1
 
 # Base is now defined here and imported by models
 Base = declarative_base()
@@ -30,7 +47,7 @@ async def get_db() -> AsyncSession:
 async def init_db():
     """Initialize the database by creating all tables."""
     # Ensure data directory exists
-    DATA_DIR.mkdir(exist_ok=True)
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
     
     # Import all models to ensure they are registered
     from .models import (
@@ -38,6 +55,15 @@ async def init_db():
         analysis, route, section, garmin_sync_log, prompt
     )
     
-    # Create all tables
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
\ No newline at end of file
+        is_sqlite = conn.dialect.name == "sqlite"
+        if is_sqlite:
+            # Skip create_all's per-table existence checks on an up-to-date database
+            result = await conn.exec_driver_sql("PRAGMA user_version")
+            if result.scalar() == SCHEMA_VERSION:
+                return
+
+        # Create all tables
+        await conn.run_sync(Base.metadata.create_all)
+        if is_sqlite:
+            await conn.exec_driver_sql(f"PRAGMA user_version = {SCHEMA_VERSION}")
\ No newline at end of file
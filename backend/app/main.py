@@ -1,5 +1,6 @@
 import logging
 import json
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
 from fastapi import FastAPI, Depends, Request, HTTPException
@@ -17,6 +18,7 @@ from .routes import workouts as workout_routes
 from .routes import prompts as prompt_routes
 from .routes import dashboard as dashboard_routes
 from .config import settings
+from .services.ai_service import aclose_http_client
 
 # Configure structured JSON logging
 class StructuredJSONFormatter(logging.Formatter):
@@ -60,10 +62,17 @@ file_handler = RotatingFileHandler(
 file_handler.setFormatter(StructuredJSONFormatter())
 logger.addHandler(file_handler)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Close the pooled OpenRouter client on the loop that opened it
+    await aclose_http_client()
+
 app = FastAPI(
     title="AI Cycling Coach API",
     description="Backend service for AI-assisted cycling training platform",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan,
 )
 
 # API Key Authentication Middleware
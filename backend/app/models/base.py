@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, DateTime
+from sqlalchemy import Column, Integer, DateTime, func
 
 # Import Base from database.py to ensure models use the same Base instance
 from ..database import Base
@@ -8,8 +8,12 @@ class BaseModel(Base):
     __abstract__ = True
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Python-side defaults fill every ORM and Core insert, including databases
+    # created before migration 003; the server defaults cover raw SQL inserts.
+    created_at = Column(DateTime, default=datetime.utcnow, server_default=func.now())
+    updated_at = Column(
+        DateTime, default=datetime.utcnow, server_default=func.now(), onupdate=datetime.utcnow
+    )
     
     def __repr__(self):
-        return f"<{self.__class__.__name__} {self.id}>"
\ No newline at end of file
+        return f"<{self.__class__.__name__} {self.id}>"
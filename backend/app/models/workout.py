@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, JSON, Boolean
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, JSON, Boolean, Index
 from sqlalchemy.orm import relationship
 from .base import BaseModel
 
@@ -8,7 +8,7 @@ class Workout(BaseModel):
     __tablename__ = "workouts"
 
     plan_id = Column(Integer, ForeignKey("plans.id"), nullable=True)
-    garmin_activity_id = Column(String(255), unique=True, nullable=False)
+    garmin_activity_id = Column(String(255), unique=True, index=True, nullable=False)
     activity_type = Column(String(50))
     start_time = Column(DateTime, nullable=False)
     duration_seconds = Column(Integer)
@@ -19,7 +19,10 @@ class Workout(BaseModel):
     max_power = Column(Float)
     avg_cadence = Column(Float)
     elevation_gain_m = Column(Float)
-    metrics = Column(JSON)  # Store full Garmin data as JSONB
+    metrics = Column(JSON)  # Garmin data not mapped to the columns above
+
+    # Workout lists are ordered newest first
+    __table_args__ = (Index("ix_workouts_start_time", start_time.desc()),)
 
     # Relationships
     plan = relationship("Plan", back_populates="workouts")
@@ -33,7 +33,7 @@ async def get_dashboard_data(db: AsyncSession = Depends(get_db)):
         # Sync status
         sync_result = await db.execute(
             select(GarminSyncLog)
-            .order_by(desc(GarminSyncLog.created_at))
+            .order_by(desc(GarminSyncLog.created_at), desc(GarminSyncLog.id))
             .limit(1)
         )
         last_sync = sync_result.scalar_one_or_none()
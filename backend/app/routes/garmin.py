@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from backend.app.dependencies import verify_api_key
 from backend.app.services.workout_sync import WorkoutSyncService
 from backend.app.database import get_db
+from backend.app.schemas.workout import WorkoutSyncStatus
 
 router = APIRouter(dependencies=[Depends(verify_api_key)])
 
@@ -16,8 +17,11 @@ async def trigger_garmin_sync(
     background_tasks.add_task(sync_service.sync_recent_activities, days_back=14)
     return {"message": "Garmin sync started"}
 
-@router.get("/sync-status")
+@router.get("/sync-status", response_model=WorkoutSyncStatus)
 async def get_sync_status(db: AsyncSession = Depends(get_db)):
     """Get latest sync status"""
     sync_service = WorkoutSyncService(db)
-    return await sync_service.get_latest_sync_status()
\ No newline at end of file
+    status = await sync_service.get_latest_sync_status()
+    if not status:
+        return WorkoutSyncStatus(status="never_synced")
+    return status
\ No newline at end of file
@@ -64,7 +64,9 @@ async def trigger_garmin_sync(
 async def get_sync_status(db: AsyncSession = Depends(get_db)):
     """Get the latest sync status."""
     result = await db.execute(
-        select(GarminSyncLog).order_by(GarminSyncLog.created_at.desc()).limit(1)
+        select(GarminSyncLog)
+        .order_by(GarminSyncLog.created_at.desc(), GarminSyncLog.id.desc())
+        .limit(1)
     )
     sync_log = result.scalar_one_or_none()
     if not sync_log:
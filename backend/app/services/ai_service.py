@@ -9,12 +9,36 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Shared by every AIService so requests reuse pooled keep-alive connections
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide OpenRouter HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(limits=httpx.Limits(max_keepalive_connections=10))
+    return _http_client
+
+
+async def aclose_http_client() -> None:
+    """Close the shared HTTP client; the next request creates a fresh one.
+
+    The client is bound to the event loop that first used it, so whichever
+    loop owns it (the API lifespan or the TUI) closes it on shutdown.
+    """
+    global _http_client
+    client, _http_client = _http_client, None
+    if client is not None:
+        await client.aclose()
+
 
 class AIService:
     """Service for AI-powered analysis and plan generation."""
 
-    def __init__(self, db_session):
+    def __init__(self, db_session, http_client: Optional[httpx.AsyncClient] = None):
         self.db = db_session
+        self.http_client = http_client
         self.prompt_manager = PromptManager(db_session)
         self.api_key = os.getenv("OPENROUTER_API_KEY")
         self.model = os.getenv("AI_MODEL", "anthropic/claude-3-sonnet-20240229")
@@ -145,31 +169,31 @@ class AIService:
 
     async def _make_ai_request(self, prompt: str) -> str:
         """Make async request to OpenRouter API with retry logic."""
-        async with httpx.AsyncClient() as client:
-            for attempt in range(3):  # Simple retry logic
-                try:
-                    response = await client.post(
-                        f"{self.base_url}/chat/completions",
-                        headers={
-                            "Authorization": f"Bearer {self.api_key}",
-                            "Content-Type": "application/json",
-                        },
-                        json={
-                            "model": self.model,
-                            "messages": [{"role": "user", "content": prompt}],
-                            "max_tokens": 2000,
-                        },
-                        timeout=30.0
-                    )
-                    response.raise_for_status()
-                    data = await response.json()
-                    return data["choices"][0]["message"]["content"]
-
-                except Exception as e:
-                    if attempt == 2:  # Last attempt
-                        logger.error(f"AI request failed after 3 attempts: {str(e)}")
-                        raise AIServiceError(f"AI request failed after 3 attempts: {str(e)}")
-                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
+        client = self.http_client or get_http_client()
+        for attempt in range(3):  # Simple retry logic
+            try:
+                response = await client.post(
+                    f"{self.base_url}/chat/completions",
+                    headers={
+                        "Authorization": f"Bearer {self.api_key}",
+                        "Content-Type": "application/json",
+                    },
+                    json={
+                        "model": self.model,
+                        "messages": [{"role": "user", "content": prompt}],
+                        "max_tokens": 2000,
+                    },
+                    timeout=30.0
+                )
+                response.raise_for_status()
+                data = await response.json()
+                return data["choices"][0]["message"]["content"]
+
+            except Exception as e:
+                if attempt == 2:  # Last attempt
+                    logger.error(f"AI request failed after 3 attempts: {str(e)}")
+                    raise AIServiceError(f"AI request failed after 3 attempts: {str(e)}")
+                await asyncio.sleep(2 ** attempt)  # Exponential backoff
 
     def _parse_workout_analysis(self, response: str) -> Dict[str, Any]:
         """Parse AI response for workout analysis."""
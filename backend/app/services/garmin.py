@@ -1,7 +1,8 @@
 import os
-from pathlib import Path
 import asyncio
+import json
 import logging
+import time
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 
@@ -13,8 +14,67 @@ from garminconnect import (
 )
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.app.database import DATA_DIR
+
 logger = logging.getLogger(__name__)
 
+# How long a successful authentication is trusted before the session is reloaded
+AUTH_TTL = timedelta(minutes=30)
+
+# On-disk cache of activity details, so repeat syncs skip the network;
+# kept in the data directory next to the database
+DETAILS_CACHE_DIR = DATA_DIR / "garmin_cache"
+DETAILS_CACHE_TTL = timedelta(days=7)
+
+# Client-side cap on Garmin API calls, kept below the server-side throttle
+GARMIN_MAX_REQUESTS = 25
+GARMIN_RATE_PERIOD_SECONDS = 60
+
+
+class AsyncRateLimiter:
+    """Token bucket allowing max_rate acquisitions per time_period seconds."""
+
+    def __init__(self, max_rate: float, time_period: float = 60):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._tokens = float(max_rate)
+        self._last_refill = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._tokens = min(self.max_rate, self._tokens + elapsed * self.max_rate / self.time_period)
+        self._last_refill = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, then consume it."""
+        while True:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) * self.time_period / self.max_rate)
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+def _client_factory() -> Garmin:
+    """Build a new Garmin Connect client; the one place tests patch to fake it."""
+    return Garmin()
+
+
+# Garmin client state is process-global and shared by every service instance
+_client: Optional[Garmin] = None
+_authenticated_at: Optional[datetime] = None
+_session_mtime: Optional[float] = None
+_auth_lock = asyncio.Lock()
+_rate_limiter = AsyncRateLimiter(GARMIN_MAX_REQUESTS, GARMIN_RATE_PERIOD_SECONDS)
+
 
 class GarminConnectService:
     """Service for interacting with Garmin Connect API."""
@@ -23,20 +83,48 @@ class GarminConnectService:
         self.db = db
         self.username = os.getenv("GARMIN_USERNAME")
         self.password = os.getenv("GARMIN_PASSWORD")
-        self.session_dir = Path("data/sessions")
+        self.session_dir = DATA_DIR / "sessions"
         self.session_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir = DETAILS_CACHE_DIR
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._cache_pruned = False
         self.client: Optional[Garmin] = None
 
     async def _get_garmin_client(self) -> Garmin:
-        """Get or create a Garmin client instance."""
+        """Get the shared Garmin client instance, creating it if needed."""
+        global _client
         if self.client:
             return self.client
 
-        self.client = Garmin()
+        if _client is None:
+            _client = _client_factory()
+        self.client = _client
         return self.client
 
     async def authenticate(self) -> bool:
-        """Authenticate with Garmin Connect and persist session."""
+        """Authenticate with Garmin Connect and persist session.
+
+        Authentication is serialized across the process and skipped while the
+        last successful login is younger than AUTH_TTL and the saved session
+        files have not changed on disk since.
+        """
+        async with _auth_lock:
+            if (
+                _authenticated_at
+                and datetime.now() - _authenticated_at < AUTH_TTL
+                and self._get_session_mtime() == _session_mtime
+            ):
+                logger.debug("Reusing authenticated Garmin session.")
+                return True
+            return await self._authenticate()
+
+    def _get_session_mtime(self) -> Optional[float]:
+        """Return the latest modification time of the saved session files."""
+        return max((p.stat().st_mtime for p in self.session_dir.glob("*")), default=None)
+
+    async def _authenticate(self) -> bool:
+        """Load a saved Garmin session or log in with credentials."""
+        global _authenticated_at, _session_mtime
         client = await self._get_garmin_client()
         try:
             logger.debug("Attempting to resume existing Garmin session.")
@@ -49,7 +137,7 @@ class GarminConnectService:
                 logger.error("Garmin username or password not set in environment variables.")
                 raise GarminAuthError("Garmin username or password not configured.")
             try:
-                logger.debug(f"Attempting to log in with username: {self.username}")
+                logger.debug("Attempting to log in with username: %s", self.username)
                 # The login method of python-garminconnect returns (token1, token2) on successful login
                 # and handles MFA internally if prompt_mfa is provided.
                 await asyncio.to_thread(client.login, self.username, self.password)
@@ -58,61 +146,121 @@ class GarminConnectService:
             except Exception as e:
                 logger.error(f"Garmin fresh authentication failed: {e}", exc_info=True)
                 raise GarminAuthError(f"Authentication failed: {e}")
+        _authenticated_at = datetime.now()
+        _session_mtime = self._get_session_mtime()
         return True
 
-    async def get_activities(self, limit: int = 10, start_date: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    async def get_activities(
+        self,
+        limit: int = 10,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
         """Fetch recent activities from Garmin Connect."""
+        global _authenticated_at
         await self.authenticate()
         client = await self._get_garmin_client()
 
-        # Convert start_date to YYYY-MM-DD string as required by garminconnect.get_activities_by_date
-        start_date_str = start_date.strftime("%Y-%m-%d") if start_date else (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
-        end_date_str = datetime.now().strftime("%Y-%m-%d")
+        # Convert dates to YYYY-MM-DD strings as required by garminconnect.get_activities_by_date
+        end_date = end_date or datetime.now()
+        start_date = start_date or end_date - timedelta(days=30)
+        start_date_str = start_date.strftime("%Y-%m-%d")
+        end_date_str = end_date.strftime("%Y-%m-%d")
 
         try:
-            logger.debug(f"Fetching Garmin activities with limit={limit}, start_date={start_date_str}.")
-            activities = await asyncio.to_thread(
-                client.get_activities_by_date,
-                start_date_str,
-                end_date_str,
-                limit=limit
-            )
+            logger.debug("Fetching Garmin activities with limit=%s, start_date=%s.", limit, start_date_str)
+            async with _rate_limiter:
+                activities = await asyncio.to_thread(
+                    client.get_activities_by_date,
+                    start_date_str,
+                    end_date_str,
+                    limit=limit
+                )
             logger.info(f"Successfully fetched {len(activities)} activities from Garmin.")
-            logger.debug(f"Garmin activities data: {activities}")
+            logger.debug("Garmin activities data: %s", activities)
             return activities or []
         except (GarminConnectConnectionError, GarminConnectTooManyRequestsError) as e:
             logger.error(f"Failed to fetch activities from Garmin: {e}", exc_info=True)
             raise GarminAPIError(f"Failed to fetch activities: {e}")
         except GarminConnectAuthenticationError as e:
             logger.error(f"Garmin authentication failed while fetching activities: {e}", exc_info=True)
+            # Force the next call to log in again instead of reusing the rejected session
+            _authenticated_at = None
             raise GarminAuthError(f"Authentication failed: {e}")
         except Exception as e:
             logger.error(f"An unexpected error occurred while fetching activities from Garmin: {e}", exc_info=True)
             raise GarminAPIError(f"Unexpected error: {e}")
 
+    def _read_cached_details(self, activity_id: str) -> Optional[Dict[str, Any]]:
+        """Return cached activity details, or None if missing or expired."""
+        path = self.cache_dir / f"{activity_id}.json"
+        try:
+            if time.time() - path.stat().st_mtime > DETAILS_CACHE_TTL.total_seconds():
+                return None
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def _write_cached_details(self, activity_id: str, details: Dict[str, Any]) -> None:
+        """Store activity details in the on-disk cache."""
+        if not self._cache_pruned:
+            self._prune_cached_details()
+        path = self.cache_dir / f"{activity_id}.json"
+        try:
+            path.write_text(json.dumps(details), encoding="utf-8")
+        except (OSError, TypeError) as e:
+            logger.warning(f"Failed to cache details for activity {activity_id}: {e}")
+
+    def _prune_cached_details(self) -> None:
+        """Delete cached details older than DETAILS_CACHE_TTL; runs once per instance."""
+        self._cache_pruned = True
+        cutoff = time.time() - DETAILS_CACHE_TTL.total_seconds()
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError as e:
+                logger.debug(f"Failed to prune cached details {path.name}: {e}")
+
     async def get_activity_details(self, activity_id: str) -> Dict[str, Any]:
         """Get detailed activity data including metrics."""
+        global _authenticated_at
+        cached = await asyncio.to_thread(self._read_cached_details, activity_id)
+        if cached is not None:
+            logger.debug("Using cached details for activity ID: %s.", activity_id)
+            return cached
+
         await self.authenticate()
         client = await self._get_garmin_client()
 
         try:
-            logger.debug(f"Fetching detailed data for activity ID: {activity_id}.")
-            details = await asyncio.to_thread(
-                client.get_activity_details, activity_id
-            )
+            logger.debug("Fetching detailed data for activity ID: %s.", activity_id)
+            async with _rate_limiter:
+                details = await asyncio.to_thread(
+                    client.get_activity_details, activity_id
+                )
             logger.info(f"Successfully fetched details for activity ID: {activity_id}.")
-            logger.debug(f"Garmin activity {activity_id} details: {details}")
-            return details
+            logger.debug("Garmin activity %s details: %s", activity_id, details)
         except (GarminConnectConnectionError, GarminConnectTooManyRequestsError) as e:
             logger.error(f"Failed to fetch activity details for {activity_id}: {e}", exc_info=True)
             raise GarminAPIError(f"Failed to fetch activity details: {e}")
         except GarminConnectAuthenticationError as e:
             logger.error(f"Garmin authentication failed while fetching activity details: {e}", exc_info=True)
+            # Force the next call to log in again instead of reusing the rejected session
+            _authenticated_at = None
             raise GarminAuthError(f"Authentication failed: {e}")
         except Exception as e:
             logger.error(f"An unexpected error occurred while fetching activity details for {activity_id}: {e}", exc_info=True)
             raise GarminAPIError(f"Unexpected error: {e}")
 
+        if details:
+            await asyncio.to_thread(self._write_cached_details, activity_id, details)
+        return details
+
+
+# Canonical import name for the Garmin Connect service
+GarminService = GarminConnectService
+
 
 class GarminAuthError(Exception):
     """Raised when Garmin authentication fails."""
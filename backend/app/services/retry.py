@@ -0,0 +1,45 @@
+import asyncio
+import functools
+import logging
+import random
+from typing import Any, Awaitable, Callable, Tuple, Type, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def retry_async(
+    exceptions: Tuple[Type[BaseException], ...],
+    attempts: int = 3,
+    initial_delay: float = 1.0,
+    max_delay: float = 30.0,
+    jitter: float = 1.0,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Retry an async function on the given exceptions with jittered exponential backoff.
+
+    The wait before retry n (0-based) is initial_delay * 2**n plus a random
+    amount up to jitter seconds, capped at max_delay. The last exception is
+    re-raised once all attempts are used.
+    """
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            for attempt in range(attempts):
+                try:
+                    return await func(*args, **kwargs)
+                except exceptions as e:
+                    if attempt == attempts - 1:
+                        logger.error(f"{func.__qualname__} failed after {attempts} attempts: {e}")
+                        raise
+                    delay = min(max_delay, initial_delay * 2**attempt + random.uniform(0, jitter))
+                    logger.warning(
+                        f"{func.__qualname__} failed (attempt {attempt + 1}/{attempts}): {e}. "
+                        f"Retrying in {delay:.1f}s."
+                    )
+                    await asyncio.sleep(delay)
+
+        return wrapper
+
+    return decorator
@@ -1,19 +1,53 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc
-from backend.app.services.garmin import GarminConnectService as GarminService, GarminAPIError, GarminAuthError
+from sqlalchemy import Row, select, desc
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from backend.app.services.garmin import GarminService, GarminAPIError, GarminAuthError
+from backend.app.services.retry import retry_async
 from backend.app.models.workout import Workout
 from backend.app.models.garmin_sync_log import GarminSyncLog, GarminSyncStatus
 from datetime import datetime, timedelta
 import logging
-from typing import Dict, Any
+import sys
+from typing import Dict, Any, List, Optional, Set
 import asyncio
 
 logger = logging.getLogger(__name__)
 
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts a trailing 'Z' natively
+    parse_iso_datetime = datetime.fromisoformat
+else:
+    def parse_iso_datetime(value: str) -> datetime:
+        """Parse an ISO 8601 timestamp, accepting a trailing 'Z' for UTC."""
+        if value.endswith('Z'):
+            value = value[:-1] + '+00:00'
+        return datetime.fromisoformat(value)
+
+# Garmin activity fields mapped to Workout columns; left out of the metrics JSON
+EXTRACTED_ACTIVITY_FIELDS = frozenset({
+    'activityId',
+    'activityType',
+    'startTimeLocal',
+    'duration',
+    'distance',
+    'averageHR',
+    'maxHR',
+    'avgPower',
+    'maxPower',
+    'averageBikingCadenceInRevPerMinute',
+    'elevationGain',
+})
+
 
 class WorkoutSyncService:
     """Service for syncing Garmin activities to database."""
 
+    max_concurrent_fetches = 8
+    # Backoff for detail fetches: retry n waits retry_base_delay * 2**n plus up to retry_jitter seconds
+    retry_base_delay = 1.0
+    retry_jitter = 1.0
+
     def __init__(self, db: AsyncSession):
         self.db = db
         self.garmin_service = GarminService()
@@ -29,61 +63,68 @@ class WorkoutSyncService:
             await self.db.commit()
             await self.db.refresh(sync_log)  # Refresh to get the generated ID
 
-            logger.debug(f"Created new GarminSyncLog with ID: {sync_log.id}")
+            logger.debug("Created new GarminSyncLog with ID: %s", sync_log.id)
 
-            # Calculate start date
-            start_date = datetime.now() - timedelta(days=days_back)
-            logger.debug(f"Fetching activities from Garmin starting from: {start_date}")
+            # Calculate the sync window once and reuse it for the sync log
+            now = datetime.now()
+            start_date = now - timedelta(days=days_back)
+            logger.debug("Fetching activities from Garmin starting from: %s", start_date)
 
             # Fetch activities from Garmin
             activities = await self.garmin_service.get_activities(
-                limit=50, start_date=start_date, end_date=datetime.now()
+                limit=50, start_date=start_date, end_date=now
+            )
+            logger.debug("Found %d activities from Garmin.", len(activities))
+
+            # Look up already-synced activities with a single query
+            existing_ids = await self.get_existing_activity_ids(
+                [str(activity['activityId']) for activity in activities]
             )
-            logger.debug(f"Found {len(activities)} activities from Garmin.")
 
-            synced_count = 0
+            new_activities = []
             for activity in activities:
                 activity_id = str(activity['activityId'])
-                logger.debug(f"Processing activity ID: {activity_id}")
-                if await self.activity_exists(activity_id):
-                    logger.debug(f"Activity {activity_id} already exists in DB, skipping.")
+                logger.debug("Processing activity ID: %s", activity_id)
+                if activity_id in existing_ids:
+                    logger.debug("Activity %s already exists in DB, skipping.", activity_id)
                     continue
+                new_activities.append(activity)
+
+            # Fetch full activity details concurrently, bounded by a semaphore
+            semaphore = asyncio.Semaphore(self.max_concurrent_fetches)
+
+            async def fetch(activity: Dict[str, Any]) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self._fetch_activity_details(str(activity['activityId']))
+
+            results = await asyncio.gather(
+                *(fetch(activity) for activity in new_activities), return_exceptions=True
+            )
+
+            workout_rows = []
+            for activity, details in zip(new_activities, results):
+                activity_id = str(activity['activityId'])
+                if isinstance(details, BaseException):
+                    raise details
 
-                # Get full activity details with retry logic
-                max_retries = 3
-                details = None
-                for attempt in range(max_retries):
-                    try:
-                        logger.debug(f"Attempt {attempt + 1} to fetch details for activity {activity_id}")
-                        details = await self.garmin_service.get_activity_details(activity_id)
-                        logger.debug(f"Successfully fetched details for activity {activity_id}.")
-                        break
-                    except (GarminAPIError, GarminAuthError) as e:
-                        logger.warning(f"Failed to fetch details for {activity_id} (attempt {attempt + 1}/{max_retries}): {e}")
-                        if attempt == max_retries - 1:
-                            logger.error(f"Max retries reached for activity {activity_id}. Skipping details fetch.", exc_info=True)
-                            raise
-                        await asyncio.sleep(2 ** attempt)
-                
                 if details is None:
                     logger.warning(f"Skipping activity {activity_id} due to failure in fetching details.")
                     continue
 
                 # Merge basic activity data with detailed metrics
                 full_activity = {**activity, **details}
-                logger.debug(f"Merged activity data for {activity_id}.")
+                logger.debug("Merged activity data for %s.", activity_id)
+
+                # Parse into workout row
+                workout_rows.append(await self.parse_activity_data(full_activity))
 
-                # Parse and create workout
-                workout_data = await self.parse_activity_data(full_activity)
-                workout = Workout(**workout_data)
-                self.db.add(workout)
-                synced_count += 1
-                logger.debug(f"Added workout {workout.garmin_activity_id} to session.")
+            synced_count = await self.insert_workouts(workout_rows)
+            logger.debug("Inserted %d new workouts.", synced_count)
 
             # Update sync log
             sync_log.status = GarminSyncStatus.COMPLETED
             sync_log.activities_synced = synced_count
-            sync_log.last_sync_time = datetime.now()
+            sync_log.last_sync_time = now
 
             await self.db.commit()
             logger.info(f"Successfully synced {synced_count} activities.")
@@ -111,35 +152,89 @@ class WorkoutSyncService:
                 await self.db.commit()
             raise
 
-    async def get_latest_sync_status(self):
-        """Get the most recent sync log entry."""
+    async def insert_workouts(self, workout_rows: List[Dict[str, Any]]) -> int:
+        """Insert workout rows in one statement, skipping activities that already exist.
+
+        Uses INSERT ... ON CONFLICT DO NOTHING on garmin_activity_id, so a
+        concurrent sync that stored the same activity first is not an error.
+        Returns the number of rows actually inserted.
+        """
+        if not workout_rows:
+            return 0
+        insert = pg_insert if self.db.get_bind().dialect.name == "postgresql" else sqlite_insert
+        stmt = insert(Workout).values(workout_rows).on_conflict_do_nothing(
+            index_elements=[Workout.garmin_activity_id]
+        )
+        result = await self.db.execute(stmt)
+        return result.rowcount
+
+    async def _fetch_activity_details(self, activity_id: str) -> Dict[str, Any]:
+        """Fetch activity details from Garmin, retrying with jittered exponential backoff."""
+        @retry_async(
+            (GarminAPIError, GarminAuthError),
+            attempts=3,
+            initial_delay=self.retry_base_delay,
+            jitter=self.retry_jitter,
+        )
+        async def fetch() -> Dict[str, Any]:
+            logger.debug("Fetching details for activity %s", activity_id)
+            return await self.garmin_service.get_activity_details(activity_id)
+
+        return await fetch()
+
+    async def get_latest_sync_status(self) -> Optional[Row]:
+        """Get the status fields of the most recent sync log entry.
+
+        Returns a row with status, last_sync_time, activities_synced and
+        error_message attributes, or None if no sync has run yet.
+        """
         logger.debug("Fetching latest Garmin sync status.")
         result = await self.db.execute(
-            select(GarminSyncLog)
-            .order_by(desc(GarminSyncLog.created_at))
+            select(
+                GarminSyncLog.status,
+                GarminSyncLog.last_sync_time,
+                GarminSyncLog.activities_synced,
+                GarminSyncLog.error_message,
+            )
+            .order_by(desc(GarminSyncLog.created_at), desc(GarminSyncLog.id))
             .limit(1)
         )
-        status = result.scalar_one_or_none()
-        logger.debug(f"Latest sync status: {status.status if status else 'None'}")
+        status = result.first()
+        logger.debug("Latest sync status: %s", status.status if status else None)
         return status
 
+    async def get_existing_activity_ids(self, garmin_activity_ids: List[str]) -> Set[str]:
+        """Return the subset of the given Garmin activity IDs already stored in the database."""
+        if not garmin_activity_ids:
+            return set()
+        logger.debug("Checking %d activities for existing workouts.", len(garmin_activity_ids))
+        result = await self.db.execute(
+            select(Workout.garmin_activity_id).where(Workout.garmin_activity_id.in_(garmin_activity_ids))
+        )
+        existing_ids = set(result.scalars().all())
+        logger.debug("Found %d activities already in database.", len(existing_ids))
+        return existing_ids
+
     async def activity_exists(self, garmin_activity_id: str) -> bool:
-        """Check if activity already exists in database."""
-        logger.debug(f"Checking if activity {garmin_activity_id} exists in database.")
+        """Check if a single activity already exists in database.
+
+        Syncing uses get_existing_activity_ids to check a whole batch at once.
+        """
+        logger.debug("Checking if activity %s exists in database.", garmin_activity_id)
         result = await self.db.execute(
-            select(Workout).where(Workout.garmin_activity_id == garmin_activity_id)
+            select(Workout.id).where(Workout.garmin_activity_id == garmin_activity_id).limit(1)
         )
-        exists = result.scalar_one_or_none() is not None
-        logger.debug(f"Activity {garmin_activity_id} exists: {exists}")
+        exists = result.scalar() is not None
+        logger.debug("Activity %s exists: %s", garmin_activity_id, exists)
         return exists
 
     async def parse_activity_data(self, activity: Dict[str, Any]) -> Dict[str, Any]:
         """Parse Garmin activity data into workout model format."""
-        logger.debug(f"Parsing activity data for Garmin activity ID: {activity.get('activityId')}")
+        logger.debug("Parsing activity data for Garmin activity ID: %s", activity.get('activityId'))
         return {
             "garmin_activity_id": str(activity['activityId']),
             "activity_type": activity.get('activityType', {}).get('typeKey'),
-            "start_time": datetime.fromisoformat(activity['startTimeLocal'].replace('Z', '+00:00')),
+            "start_time": parse_iso_datetime(activity['startTimeLocal']),
             "duration_seconds": activity.get('duration'),
             "distance_m": activity.get('distance'),
             "avg_hr": activity.get('averageHR'),
@@ -148,5 +243,6 @@ class WorkoutSyncService:
             "max_power": activity.get('maxPower'),
             "avg_cadence": activity.get('averageBikingCadenceInRevPerMinute'),
             "elevation_gain_m": activity.get('elevationGain'),
-            "metrics": activity  # Store full Garmin data as JSONB
+            # Store remaining Garmin data as JSONB
+            "metrics": {k: v for k, v in activity.items() if k not in EXTRACTED_ACTIVITY_FIELDS}
         }
\ No newline at end of file
@@ -1,69 +1,111 @@
+import asyncio
+import aiosqlite
 import pytest
-from fastapi.testclient import TestClient
+from dotenv import load_dotenv
+from unittest.mock import AsyncMock, MagicMock
+from httpx import AsyncClient
 from backend.app.main import app
-from backend.app.database import get_db, Base
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from backend.app.database import get_db, Base, JSON_OPTIONS
+from backend.app.services import garmin
+from backend.app.services.workout_sync import WorkoutSyncService
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.pool import StaticPool
 
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
+def pytest_configure(config):
+    # Load .env once, before collection, so skipif markers can see live Garmin credentials
+    load_dotenv()
+
+# Empty copy of the schema, built by the first db_session and copied over the
+# test database with SQLite's backup API for every test after that
+_schema_template = None
+
+async def restore_schema(conn):
+    """Reset the database behind conn to the empty schema."""
+    global _schema_template
+    raw = await conn.get_raw_connection()
+    if _schema_template is None:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.commit()
+        _schema_template = await aiosqlite.connect(":memory:")
+        await raw.driver_connection.backup(_schema_template)
+    else:
+        await _schema_template.backup(raw.driver_connection)
+
+@pytest.fixture(scope="session", autouse=True)
+def close_schema_template():
+    yield
+    if _schema_template is not None:
+        asyncio.run(_schema_template.close())
+
+@pytest.fixture(autouse=True)
+def reset_garmin_shared_state(monkeypatch, tmp_path):
+    """Give each test a fresh shared Garmin client, auth state and details cache."""
+    monkeypatch.setattr(garmin, "DETAILS_CACHE_DIR", tmp_path / "garmin_cache")
+    monkeypatch.setattr(garmin, "_client", None)
+    monkeypatch.setattr(garmin, "_authenticated_at", None)
+    monkeypatch.setattr(garmin, "_session_mtime", None)
+    monkeypatch.setattr(
+        garmin, "_rate_limiter",
+        garmin.AsyncRateLimiter(garmin.GARMIN_MAX_REQUESTS, garmin.GARMIN_RATE_PERIOD_SECONDS),
+    )
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """Make retry backoff instant; the returned mock records the requested delays."""
+    mock_sleep = AsyncMock()
+    monkeypatch.setattr("backend.app.services.retry.asyncio.sleep", mock_sleep)
+    return mock_sleep
+
+@pytest.fixture
+def sync_service():
+    """WorkoutSyncService over a mocked session and Garmin service.
+
+    Returns (service, mock_db, mock_garmin).
+    """
+    mock_db = AsyncMock()
+    mock_db.add = MagicMock()  # add and get_bind are synchronous
+    mock_db.get_bind = MagicMock()
+    service = WorkoutSyncService(mock_db)
+    service.garmin_service = AsyncMock()
+    return service, mock_db, service.garmin_service
+
 @pytest.fixture(scope="session")
 def test_engine():
-    engine = create_async_engine(TEST_DATABASE_URL)
+    # StaticPool keeps every session on the same in-memory database
+    engine = create_async_engine(
+        TEST_DATABASE_URL,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+        **JSON_OPTIONS,
+    )
+
     yield engine
     # engine disposal can be handled via an async fixture if needed
 
 @pytest.fixture
 async def db_session(test_engine):
+    async with test_engine.connect() as conn:
+        # Start from an empty schema; this also discards the previous test's data
+        await restore_schema(conn)
+
+    # begin() commits or rolls back the connection's transaction and the
+    # session context closes the session, so no manual bookkeeping is needed
     async with test_engine.begin() as conn:
-        # Create all tables
-        await conn.run_sync(Base.metadata.create_all)
-        
         async with AsyncSession(conn) as session:
-            try:
-                yield session
-                await session.commit()  # Commit any changes made during the test
-            except Exception:
-                await session.rollback()  # Rollback in case of an exception
-                raise
-            finally:
-                await session.close()
-                
-        # Drop all tables after the test
-        await conn.run_sync(Base.metadata.drop_all)
-
-# The TestClient is synchronous, but our app is async.
-# We need to handle the async session in a way that works with the sync TestClient.
-# The most common approach is to use an async sessionmaker and override the dependency
-# to create and close a session per request, even though the test is sync.
-
-from sqlalchemy.ext.asyncio import async_sessionmaker
+            yield session
 
 @pytest.fixture
-def client(test_engine):
-    # Create an async sessionmaker
-    AsyncSessionLocal = async_sessionmaker(test_engine, expire_on_commit=False)
-    
-    def override_get_db():
-        # Create a new session for each request
-        session = AsyncSessionLocal()
-        try:
+async def client(test_engine):
+    """Async HTTP client for the app, with a DB session per request."""
+    TestSessionLocal = async_sessionmaker(test_engine, expire_on_commit=False)
+
+    async def override_get_db():
+        async with TestSessionLocal() as session:
             yield session
-        finally:
-            # The TestClient will handle closing the session via the generator
-            import asyncio
-            # Since we're in a sync context of TestClient, but session is async,
-            # we need to close it asynchronously. This is tricky.
-            # A better approach for testing async DB with sync TestClient is to
-            # make the override function async, but FastAPI TestClient expects sync.
-            # For now, let's try to handle it in the finally block.
-            # However, this approach has limitations.
-            # A more robust solution is to have a separate async client test setup
-            # or to use httpx.AsyncClient for async tests.
-            # For the scope of fixing the workout sync tests, we'll focus on the
-            # service-level tests which don't rely on the TestClient.
-            # If the TestClient is needed for other tests, they may need refactoring.
-            pass
-            
+
     app.dependency_overrides[get_db] = override_get_db
-    return TestClient(app)
\ No newline at end of file
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        yield ac
+    app.dependency_overrides.pop(get_db, None)
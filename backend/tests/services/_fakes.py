@@ -0,0 +1,43 @@
+"""Lightweight stand-ins for SQLAlchemy objects used by the mocked-session tests."""
+
+
+class FakeScalars:
+    """Mimics the ScalarResult returned by Result.scalars()."""
+
+    __slots__ = ("_rows",)
+
+    def __init__(self, rows):
+        self._rows = list(rows)
+
+    def all(self):
+        return list(self._rows)
+
+    def first(self):
+        return self._rows[0] if self._rows else None
+
+
+class FakeResult:
+    """Mimics an executed Result with fixed values.
+
+    ``value`` is what the single-row accessors return; ``rows`` backs
+    ``scalars()``. Like the real Result, every accessor is synchronous.
+    """
+
+    __slots__ = ("_value", "_rows", "rowcount")
+
+    def __init__(self, value=None, *, rows=(), rowcount=0):
+        self._value = value
+        self._rows = rows
+        self.rowcount = rowcount
+
+    def scalar(self):
+        return self._value
+
+    def scalar_one_or_none(self):
+        return self._value
+
+    def first(self):
+        return self._value
+
+    def scalars(self):
+        return FakeScalars(self._rows)
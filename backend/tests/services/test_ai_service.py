@@ -1,17 +1,27 @@
+import asyncio
+import httpx
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
+from backend.app.services import ai_service as ai_service_module
 from backend.app.services.ai_service import AIService, AIServiceError
 from backend.app.models.workout import Workout
 import json
 
+@pytest.fixture(scope="module")
+def shared_http_client():
+    """One pooled HTTP client reused by every AIService in this module."""
+    client = httpx.AsyncClient(limits=httpx.Limits(max_keepalive_connections=10))
+    yield client
+    asyncio.run(client.aclose())
+
 @pytest.mark.asyncio
-async def test_analyze_workout_success():
+async def test_analyze_workout_success(shared_http_client):
     """Test successful workout analysis with valid API response"""
     mock_db = MagicMock()
     mock_prompt = MagicMock()
     mock_prompt.format.return_value = "test prompt"
     
-    ai_service = AIService(mock_db)
+    ai_service = AIService(mock_db, http_client=shared_http_client)
     ai_service.prompt_manager.get_active_prompt = AsyncMock(return_value=mock_prompt)
     
     test_response = json.dumps({
@@ -32,10 +42,10 @@ async def test_analyze_workout_success():
         assert len(result["suggestions"]) == 1
 
 @pytest.mark.asyncio
-async def test_generate_plan_success():
+async def test_generate_plan_success(shared_http_client):
     """Test plan generation with structured response"""
     mock_db = AsyncMock()
-    ai_service = AIService(mock_db)
+    ai_service = AIService(mock_db, http_client=shared_http_client)
     ai_service.prompt_manager.get_active_prompt = AsyncMock(return_value="Plan prompt: {rules_text} {goals}")
 
     test_plan = {
@@ -54,10 +64,10 @@ async def test_generate_plan_success():
         assert result["focus"] == "endurance"
 
 @pytest.mark.asyncio
-async def test_api_retry_logic():
+async def test_api_retry_logic(shared_http_client):
     """Test API request retries on failure"""
     mock_db = MagicMock()
-    ai_service = AIService(mock_db)
+    ai_service = AIService(mock_db, http_client=shared_http_client)
     
     with patch('httpx.AsyncClient.post') as mock_post:
         mock_post.side_effect = Exception("API failure")
@@ -68,10 +78,10 @@ async def test_api_retry_logic():
         assert mock_post.call_count == 3
 
 @pytest.mark.asyncio
-async def test_invalid_json_handling():
+async def test_invalid_json_handling(shared_http_client):
     """Test graceful handling of invalid JSON responses"""
     mock_db = AsyncMock()
-    ai_service = AIService(mock_db)
+    ai_service = AIService(mock_db, http_client=shared_http_client)
 
     with patch('httpx.AsyncClient.post') as mock_post:
         mock_response = AsyncMock()
@@ -84,10 +94,10 @@ async def test_invalid_json_handling():
         assert not result["structured"]
 
 @pytest.mark.asyncio
-async def test_code_block_parsing():
+async def test_code_block_parsing(shared_http_client):
     """Test extraction of JSON from code blocks"""
     mock_db = AsyncMock()
-    ai_service = AIService(mock_db)
+    ai_service = AIService(mock_db, http_client=shared_http_client)
 
     test_response = "```json\n" + json.dumps({"max_rides": 4}) + "\n```"
     
@@ -99,4 +109,28 @@ async def test_code_block_parsing():
         
         result = await ai_service.evolve_plan({})
         assert "max_rides" in result
-        assert result["max_rides"] == 4
\ No newline at end of file
+        assert result["max_rides"] == 4
+
+
+@pytest.mark.asyncio
+async def test_ai_requests_share_default_http_client(monkeypatch):
+    """Test that services without an injected client share one pooled client"""
+    monkeypatch.setattr(ai_service_module, "_http_client", None)
+    first = AIService(MagicMock())
+    second = AIService(MagicMock())
+
+    with patch('httpx.AsyncClient.post') as mock_post:
+        mock_response = AsyncMock()
+        mock_response.json.return_value = {"choices": [{"message": {"content": "ok"}}]}
+        mock_post.return_value = mock_response
+
+        assert await first._make_ai_request("a") == "ok"
+        assert await second._make_ai_request("b") == "ok"
+
+    client = ai_service_module._http_client
+    assert client is not None
+    assert ai_service_module.get_http_client() is client
+
+    await ai_service_module.aclose_http_client()
+    assert client.is_closed
+    assert ai_service_module._http_client is None
@@ -1,81 +1,80 @@
 import os
-from unittest.mock import AsyncMock, MagicMock, patch
+import time
+from unittest.mock import MagicMock, call, patch
 import pytest
-from backend.app.services.garmin import GarminConnectService as GarminService, GarminAuthError, GarminAPIError
-from backend.app.models.garmin_sync_log import GarminSyncStatus
-from datetime import datetime, timedelta
-import garth # Import garth for type hinting
+from garminconnect import Garmin, GarminConnectAuthenticationError, GarminConnectConnectionError
+from backend.app.services.garmin import (
+    DETAILS_CACHE_TTL, GarminConnectService as GarminService, GarminAuthError, GarminAPIError
+)
+from datetime import datetime
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_env_vars():
     with patch.dict(os.environ, {"GARMIN_USERNAME": "test_user", "GARMIN_PASSWORD": "test_password"}):
         yield
 
-def create_garmin_client_mock():
-    mock_client_instance = MagicMock(spec=GarminService) # Use GarminService (which is GarminConnectService)
-    mock_client_instance.authenticate = AsyncMock(return_value=True)
-    mock_client_instance.get_activities = AsyncMock(return_value=[])
-    mock_client_instance.get_activity_details = AsyncMock(return_value={})
-    mock_client_instance.is_authenticated = MagicMock(return_value=True)
+# Computed once so each mock doesn't re-walk the Garmin client for its spec
+_GARMIN_SPEC = [name for name in dir(Garmin) if not name.startswith('_')]
+
+@pytest.fixture
+def garmin_client_mock():
+    mock_client_instance = MagicMock(spec=_GARMIN_SPEC)
+    # garth is set per instance in Garmin.__init__, so it is not in the spec
+    mock_client_instance.garth = MagicMock()
+    mock_client_instance.get_activities_by_date.return_value = []
+    mock_client_instance.get_activity_details.return_value = {}
     return mock_client_instance
 
+@pytest.mark.parametrize("resume_exc,login_exc,expected", [
+    (FileNotFoundError, None, "login"),
+    (FileNotFoundError, Exception("Invalid credentials"), GarminAuthError),
+    (None, None, "resumed"),
+], ids=["fresh_login", "auth_fail", "session_reuse"])
 @pytest.mark.asyncio
-async def test_garmin_authentication_success(db_session, mock_env_vars):
-    """Test successful Garmin Connect authentication"""
-    with patch('backend.app.services.garmin.garth.Client') as mock_client_class:
+async def test_garmin_authentication(resume_exc, login_exc, expected, db_session, mock_env_vars):
+    """Test authentication via a fresh login, a failed login and a saved session"""
+    with patch('backend.app.services.garmin._client_factory') as mock_client_class:
         mock_instance = mock_client_class.return_value
-        mock_instance.load.side_effect = FileNotFoundError
+        # First login() resumes the saved session, the second logs in with credentials
+        mock_instance.login.side_effect = [resume_exc, login_exc]
         service = GarminService(db_session)
-        result = await service.authenticate()
-        assert result is True
-        mock_instance.login.assert_called_once_with(os.getenv("GARMIN_USERNAME"), os.getenv("GARMIN_PASSWORD"))
-        mock_instance.save.assert_called_once_with(service.session_dir)
+        if expected is GarminAuthError:
+            with pytest.raises(GarminAuthError):
+                await service.authenticate()
+        else:
+            assert await service.authenticate() is True
 
-@pytest.mark.asyncio
-async def test_garmin_authentication_failure(db_session, mock_env_vars):
-    """Test authentication failure handling"""
-    with patch('backend.app.services.garmin.garth.Client') as mock_client_class:
-        mock_instance = mock_client_class.return_value
-        mock_instance.load.side_effect = FileNotFoundError
-        mock_instance.login.side_effect = Exception("Invalid credentials")
-        service = GarminService(db_session)
-        with pytest.raises(GarminAuthError):
-            await service.authenticate()
-        mock_instance.login.assert_called_once_with(os.getenv("GARMIN_USERNAME"), os.getenv("GARMIN_PASSWORD"))
-        mock_instance.save.assert_not_called()
-
-@pytest.mark.asyncio
-async def test_garmin_authentication_load_session_success(db_session, mock_env_vars):
-    """Test successful loading of existing Garmin session"""
-    with patch('backend.app.services.garmin.garth.Client') as mock_client_class:
-        mock_instance = mock_client_class.return_value
-        mock_instance.load.side_effect = None
-        service = GarminService(db_session)
-        result = await service.authenticate()
-        assert result is True
-        mock_instance.load.assert_called_once_with(service.session_dir)
-        mock_instance.login.assert_not_called()
-        mock_instance.save.assert_not_called()
+        resume_call = call(str(service.session_dir))
+        if expected == "resumed":
+            assert mock_instance.login.call_args_list == [resume_call]
+        else:
+            assert mock_instance.login.call_args_list == [
+                resume_call, call(os.getenv("GARMIN_USERNAME"), os.getenv("GARMIN_PASSWORD"))
+            ]
+        if expected == "login":
+            mock_instance.garth.dump.assert_called_once_with(str(service.session_dir))
+        else:
+            mock_instance.garth.dump.assert_not_called()
 
 @pytest.mark.asyncio
 async def test_garmin_authentication_missing_credentials(db_session):
     """Test authentication failure when credentials are missing"""
     with patch.dict(os.environ, {"GARMIN_USERNAME": "", "GARMIN_PASSWORD": ""}):
-        with patch('backend.app.services.garmin.garth.Client') as mock_client_class:
+        with patch('backend.app.services.garmin._client_factory') as mock_client_class:
             mock_instance = mock_client_class.return_value
-            mock_instance.load.side_effect = FileNotFoundError
+            mock_instance.login.side_effect = FileNotFoundError
             service = GarminService(db_session)
             with pytest.raises(GarminAuthError, match="Garmin username or password not configured."):
                 await service.authenticate()
-            mock_instance.login.assert_not_called()
-            mock_instance.save.assert_not_called()
+            mock_instance.login.assert_called_once_with(str(service.session_dir))
+            mock_instance.garth.dump.assert_not_called()
 
 @pytest.mark.asyncio
-async def test_activity_sync(db_session, mock_env_vars):
+async def test_activity_sync(db_session, mock_env_vars, garmin_client_mock):
     """Test successful activity synchronization"""
-    with patch('backend.app.services.garmin.garth.Client', new_callable=create_garth_client_mock) as mock_client_class:
+    with patch('backend.app.services.garmin._client_factory', return_value=garmin_client_mock) as mock_client_class:
         mock_instance = mock_client_class.return_value
-        mock_instance.get_activities.return_value = [
+        mock_instance.get_activities_by_date.return_value = [
             {"activityId": 123, "startTime": "2024-01-01T08:00:00"}
         ]
         service = GarminService(db_session)
@@ -83,43 +82,43 @@ async def test_activity_sync(db_session, mock_env_vars):
         activities = await service.get_activities()
         assert len(activities) == 1
         assert activities[0]["activityId"] == 123
-        mock_instance.get_activities.assert_called_once()
+        mock_instance.get_activities_by_date.assert_called_once()
 
 @pytest.mark.asyncio
-async def test_rate_limiting_handling(db_session, mock_env_vars):
+async def test_rate_limiting_handling(db_session, mock_env_vars, garmin_client_mock):
     """Test API rate limit error handling"""
-    with patch('backend.app.services.garmin.garth.Client', new_callable=create_garth_client_mock) as mock_client_class:
+    with patch('backend.app.services.garmin._client_factory', return_value=garmin_client_mock) as mock_client_class:
         mock_instance = mock_client_class.return_value
-        mock_instance.get_activities.side_effect = Exception("Rate limit exceeded")
+        mock_instance.get_activities_by_date.side_effect = Exception("Rate limit exceeded")
         service = GarminService(db_session)
         service.client = mock_instance
         with pytest.raises(GarminAPIError):
             await service.get_activities()
-        mock_instance.get_activities.assert_called_once()
+        mock_instance.get_activities_by_date.assert_called_once()
 
 @pytest.mark.asyncio
-async def test_get_activity_details_success(db_session, mock_env_vars):
+async def test_get_activity_details_success(db_session, mock_env_vars, garmin_client_mock):
     """Test successful retrieval of activity details."""
-    with patch('backend.app.services.garmin.garth.Client', new_callable=create_garth_client_mock) as mock_client_class:
+    with patch('backend.app.services.garmin._client_factory', return_value=garmin_client_mock) as mock_client_class:
         mock_instance = mock_client_class.return_value
-        mock_instance.get_activity.return_value = {"activityId": 123, "details": "data"}
+        mock_instance.get_activity_details.return_value = {"activityId": 123, "details": "data"}
         service = GarminService(db_session)
         service.client = mock_instance
         details = await service.get_activity_details("123")
         assert details["activityId"] == 123
-        mock_instance.get_activity.assert_called_once_with("123")
+        mock_instance.get_activity_details.assert_called_once_with("123")
 
 @pytest.mark.asyncio
-async def test_get_activity_details_failure(db_session, mock_env_vars):
+async def test_get_activity_details_failure(db_session, mock_env_vars, garmin_client_mock):
     """Test failure in retrieving activity details."""
-    with patch('backend.app.services.garmin.garth.Client', new_callable=create_garth_client_mock) as mock_client_class:
+    with patch('backend.app.services.garmin._client_factory', return_value=garmin_client_mock) as mock_client_class:
         mock_instance = mock_client_class.return_value
-        mock_instance.get_activity.side_effect = Exception("Activity not found")
+        mock_instance.get_activity_details.side_effect = GarminConnectConnectionError("Activity not found")
         service = GarminService(db_session)
         service.client = mock_instance
         with pytest.raises(GarminAPIError, match="Failed to fetch activity details"):
             await service.get_activity_details("123")
-        mock_instance.get_activity.assert_called_once_with("123")
+        mock_instance.get_activity_details.assert_called_once_with("123")
 
 @pytest.mark.asyncio
 async def test_is_authenticated(db_session):
@@ -127,4 +126,120 @@ async def test_is_authenticated(db_session):
     service = GarminService(db_session)
     assert service.is_authenticated() is False
     service.client = MagicMock()
-    assert service.is_authenticated() is True
\ No newline at end of file
+    assert service.is_authenticated() is True
+
+@pytest.mark.asyncio
+async def test_authentication_shared_across_instances(mock_env_vars):
+    """Test that a successful login is reused by other service instances"""
+    with patch('backend.app.services.garmin._client_factory') as mock_garmin_class:
+        mock_instance = mock_garmin_class.return_value
+        first = GarminService()
+        second = GarminService()
+        assert await first.authenticate() is True
+        assert await second.authenticate() is True
+        mock_garmin_class.assert_called_once()
+        mock_instance.login.assert_called_once_with(str(first.session_dir))
+
+
+@pytest.mark.asyncio
+async def test_authentication_reloads_when_session_files_change(mock_env_vars, tmp_path):
+    """Test that a changed session directory forces the session to be reloaded"""
+    with patch('backend.app.services.garmin._client_factory') as mock_garmin_class:
+        mock_instance = mock_garmin_class.return_value
+        service = GarminService()
+        service.session_dir = tmp_path
+        assert await service.authenticate() is True
+        assert await service.authenticate() is True
+        assert mock_instance.login.call_count == 1
+
+        token_file = tmp_path / "oauth2_token.json"
+        token_file.write_text("{}")
+        assert await service.authenticate() is True
+        assert mock_instance.login.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_auth_error_forces_fresh_login(mock_env_vars):
+    """Test that a rejected session is not reused on the next call"""
+    with patch('backend.app.services.garmin._client_factory') as mock_garmin_class:
+        mock_instance = mock_garmin_class.return_value
+        mock_instance.get_activities_by_date.side_effect = [
+            GarminConnectAuthenticationError("Session expired"),
+            [{"activityId": 1}],
+        ]
+        service = GarminService()
+        with pytest.raises(GarminAuthError):
+            await service.get_activities()
+        assert mock_instance.login.call_count == 1
+
+        assert await service.get_activities() == [{"activityId": 1}]
+        assert mock_instance.login.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_activities_uses_date_range(mock_env_vars):
+    """Test that get_activities queries Garmin with the requested date range"""
+    with patch('backend.app.services.garmin._client_factory') as mock_garmin_class:
+        mock_instance = mock_garmin_class.return_value
+        mock_instance.get_activities_by_date.return_value = [{"activityId": 1}]
+        service = GarminService()
+        activities = await service.get_activities(
+            limit=5, start_date=datetime(2024, 1, 1), end_date=datetime(2024, 1, 31)
+        )
+        assert activities == [{"activityId": 1}]
+        mock_instance.get_activities_by_date.assert_called_once_with("2024-01-01", "2024-01-31", limit=5)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_waits_when_tokens_exhausted():
+    """Test that the rate limiter sleeps once its token bucket is empty"""
+    from backend.app.services.garmin import AsyncRateLimiter
+    clock = [1000.0]
+
+    async def fake_sleep(seconds):
+        clock[0] += seconds
+
+    with patch('backend.app.services.garmin.time.monotonic', side_effect=lambda: clock[0]), \
+         patch('backend.app.services.garmin.asyncio.sleep', side_effect=fake_sleep) as mock_sleep:
+        limiter = AsyncRateLimiter(max_rate=2, time_period=10)
+        async with limiter:
+            pass
+        async with limiter:
+            pass
+        mock_sleep.assert_not_called()
+        async with limiter:
+            pass
+        mock_sleep.assert_called_once_with(5.0)
+
+
+@pytest.mark.asyncio
+async def test_get_activity_details_uses_disk_cache(mock_env_vars):
+    """Test that fetched activity details are served from the on-disk cache"""
+    with patch('backend.app.services.garmin._client_factory') as mock_garmin_class:
+        mock_instance = mock_garmin_class.return_value
+        mock_instance.get_activity_details.return_value = {"activityId": 123, "averageHR": 150}
+        service = GarminService()
+        first = await service.get_activity_details("123")
+        second = await GarminService().get_activity_details("123")
+        assert first == second == {"activityId": 123, "averageHR": 150}
+        mock_instance.get_activity_details.assert_called_once_with("123")
+
+
+@pytest.mark.asyncio
+async def test_writing_activity_details_prunes_expired_cache_entries(mock_env_vars):
+    """Test that stale cache files are removed when new details are cached"""
+    with patch('backend.app.services.garmin._client_factory') as mock_garmin_class:
+        mock_garmin_class.return_value.get_activity_details.return_value = {"activityId": 123}
+        service = GarminService()
+        stale = service.cache_dir / "999.json"
+        stale.write_text("{}")
+        expired = time.time() - DETAILS_CACHE_TTL.total_seconds() - 60
+        os.utime(stale, (expired, expired))
+        fresh = service.cache_dir / "456.json"
+        fresh.write_text("{}")
+
+        await service.get_activity_details("123")
+
+        assert not stale.exists()
+        assert fresh.exists()
+        assert (service.cache_dir / "123.json").exists()
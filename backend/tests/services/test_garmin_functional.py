@@ -4,15 +4,80 @@ These tests verify the end-to-end functionality of Garmin integration.
 """
 import pytest
 import os
-from unittest.mock import AsyncMock, patch, MagicMock
+from unittest.mock import patch, MagicMock
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert, select
 
 from backend.app.services.garmin import GarminConnectService as GarminService, GarminAuthError, GarminAPIError
 from backend.app.services.workout_sync import WorkoutSyncService
 from backend.app.models.workout import Workout
-from backend.app.models.garmin_sync_log import GarminSyncLog
+from backend.app.models.garmin_sync_log import GarminSyncLog, GarminSyncStatus
+
+
+_SELECT_SYNC_LOGS_DESC = select(GarminSyncLog).order_by(
+    GarminSyncLog.created_at.desc(), GarminSyncLog.id.desc()
+)
+
+# Shared Garmin payloads; copy with dict() before handing them to a mock
+_CYCLING_ACTIVITY = MappingProxyType({
+    'activityId': '12345',
+    'startTimeLocal': '2024-01-15T08:00:00.000Z',
+    'activityType': {'typeKey': 'cycling'},
+    'duration': 3600.0,
+    'distance': 25000.0
+})
+
+_CYCLING_METRICS = MappingProxyType({
+    'averageHR': 140.0,
+    'maxHR': 170.0,
+    'avgPower': 200.0,
+    'maxPower': 350.0,
+    'averageBikingCadenceInRevPerMinute': 85.0,
+    'elevationGain': 500.0
+})
+
+
+class _GarminStub:
+    """Stand-in for the garminconnect client with just the methods the service uses."""
+    __slots__ = ("login", "garth", "get_activities_by_date", "get_activity_details")
+
+    def __init__(self):
+        # The service calls every client method synchronously via asyncio.to_thread
+        self.login = MagicMock(return_value=(None, None))
+        self.garth = MagicMock()
+        self.get_activities_by_date = MagicMock(return_value=[])
+        self.get_activity_details = MagicMock(return_value={})
+
+
+def make_flaky(fail_n, then):
+    """Client method that raises fail_n times, then returns then."""
+    calls = {"n": 0}
+
+    def fn(*args, **kwargs):
+        calls["n"] += 1
+        if calls["n"] <= fail_n:
+            raise Exception("Temporary error")
+        return then
+
+    return fn, calls
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mock_env_vars():
+    """Garmin credentials for every test in this module."""
+    with patch.dict(os.environ, {
+        'GARMIN_USERNAME': 'test@example.com',
+        'GARMIN_PASSWORD': 'testpass123'
+    }):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def mock_sleep(no_sleep):
+    """Skip the real retry backoff; tests can inspect the requested delays."""
+    return no_sleep
 
 
 @pytest.fixture
@@ -32,111 +97,67 @@ async def workout_sync_service(db_session: AsyncSession):
 class TestGarminAuthentication:
     """Test Garmin Connect authentication functionality."""
 
-    @patch.dict(os.environ, {
-        'GARMIN_USERNAME': 'test@example.com',
-        'GARMIN_PASSWORD': 'testpass123'
-    })
-    @patch('garminconnect.Garmin')
+    @patch('backend.app.services.garmin._client_factory')
     async def test_successful_authentication(self, mock_client_class, garmin_service):
         """Test successful authentication with valid credentials."""
         # Setup mock client
-        mock_client = MagicMock()
-        mock_client.login = AsyncMock(return_value=(None, None))
-        mock_client.save = MagicMock()
+        mock_client = _GarminStub()
+        # No saved session, so the service falls back to the credentials
+        mock_client.login.side_effect = [FileNotFoundError, (None, None)]
         mock_client_class.return_value = mock_client
 
         # Test authentication
         result = await garmin_service.authenticate()
 
         assert result is True
-        mock_client.login.assert_awaited_once_with('test@example.com', 'testpass123')
-        mock_client.save.assert_called_once()
-
-    @patch.dict(os.environ, {
-        'GARMIN_USERNAME': 'invalid@example.com',
-        'GARMIN_PASSWORD': 'wrongpass'
-    })
-    @patch('garminconnect.Garmin')
+        mock_client.login.assert_called_with('test@example.com', 'testpass123')
+        mock_client.garth.dump.assert_called_once_with(str(garmin_service.session_dir))
+
+    @patch('backend.app.services.garmin._client_factory')
     async def test_failed_authentication(self, mock_client_class, garmin_service):
         """Test authentication failure with invalid credentials."""
-        # Setup mock client to raise exception
-        mock_client = MagicMock()
-        mock_client.login = AsyncMock(side_effect=Exception("Invalid credentials"))
+        # Setup mock client: no saved session, then the credential login fails
+        mock_client = _GarminStub()
+        mock_client.login.side_effect = [FileNotFoundError, Exception("Invalid credentials")]
         mock_client_class.return_value = mock_client
 
         # Test authentication
-        with pytest.raises(GarminAuthError, match="Authentication failed"):
+        with pytest.raises(GarminAuthError, match="Authentication failed: Invalid credentials"):
             await garmin_service.authenticate()
+        mock_client.garth.dump.assert_not_called()
 
-    @patch.dict(os.environ, {
-        'GARMIN_USERNAME': 'test@example.com',
-        'GARMIN_PASSWORD': 'testpass123'
-    })
-    @patch('garminconnect.Garmin')
+    @patch('backend.app.services.garmin._client_factory')
     async def test_session_reuse(self, mock_client_class, garmin_service):
         """Test that existing sessions are reused."""
-        # Setup mock client with load method
-        mock_client = MagicMock()
-        mock_client.login = AsyncMock(return_value=(None, None)) # Login handles loading from tokenstore
+        # Setup mock client; login(session_dir) resumes the saved tokens
+        mock_client = _GarminStub()
         mock_client_class.return_value = mock_client
 
         # Test authentication
         result = await garmin_service.authenticate()
 
         assert result is True
-        mock_client.login.assert_awaited_once_with(tokenstore=garmin_service.session_dir)
-        mock_client.save.assert_not_called()
+        mock_client.login.assert_called_once_with(str(garmin_service.session_dir))
+        mock_client.garth.dump.assert_not_called()
 
 
 class TestWorkoutSyncing:
     """Test workout synchronization functionality."""
 
-    @patch.dict(os.environ, {
-        'GARMIN_USERNAME': 'test@example.com',
-        'GARMIN_PASSWORD': 'testpass123'
-    })
-    @patch('garminconnect.Garmin')
+    @patch('backend.app.services.garmin._client_factory')
     async def test_successful_sync_recent_activities(self, mock_client_class, workout_sync_service, db_session):
         """Test successful synchronization of recent activities."""
         # Setup mock Garmin client
-        mock_client = MagicMock()
-        mock_client.login = AsyncMock(return_value=True)
-        mock_client.save = MagicMock()
+        mock_client = _GarminStub()
 
         # Mock activity data
-        mock_activities = [
-            {
-                'activityId': '12345',
-                'startTimeLocal': '2024-01-15T08:00:00.000Z',
-                'activityType': {'typeKey': 'cycling'},
-                'duration': 3600.0,
-                'distance': 25000.0,
-                'averageHR': 140.0,
-                'maxHR': 170.0,
-                'avgPower': 200.0,
-                'maxPower': 350.0,
-                'averageBikingCadenceInRevPerMinute': 85.0,
-                'elevationGain': 500.0
-            }
-        ]
+        mock_activities = [dict(_CYCLING_ACTIVITY, **_CYCLING_METRICS)]
 
         # Mock detailed activity data
-        mock_details = {
-            'activityId': '12345',
-            'startTimeLocal': '2024-01-15T08:00:00.000Z',
-            'activityType': {'typeKey': 'cycling'},
-            'duration': 3600.0,
-            'distance': 25000.0,
-            'averageHR': 140.0,
-            'maxHR': 170.0,
-            'avgPower': 200.0,
-            'maxPower': 350.0,
-            'averageBikingCadenceInRevPerMinute': 85.0,
-            'elevationGain': 500.0
-        }
-
-        mock_client.get_activities_by_date = MagicMock(return_value=mock_activities)
-        mock_client.get_activity_details = MagicMock(return_value=mock_details)
+        mock_details = dict(_CYCLING_ACTIVITY, **_CYCLING_METRICS)
+
+        mock_client.get_activities_by_date.return_value = mock_activities
+        mock_client.get_activity_details.return_value = mock_details
         mock_client_class.return_value = mock_client
 
         # Test sync
@@ -155,49 +176,32 @@ class TestWorkoutSyncing:
         assert workout.distance_m == 25000.0
 
         # Verify sync log was created
-        sync_log_result = await db_session.execute(
-            select(GarminSyncLog).order_by(GarminSyncLog.created_at.desc())
-        )
+        sync_log_result = await db_session.execute(_SELECT_SYNC_LOGS_DESC)
         sync_log = sync_log_result.scalar_one_or_none()
         assert sync_log is not None
-        assert sync_log.status == 'success'
+        assert sync_log.status == GarminSyncStatus.COMPLETED
         assert sync_log.activities_synced == 1
 
-    @patch.dict(os.environ, {
-        'GARMIN_USERNAME': 'test@example.com',
-        'GARMIN_PASSWORD': 'testpass123'
-    })
-    @patch('garth.Client')
+    @patch('backend.app.services.garmin._client_factory')
     async def test_sync_with_duplicate_activities(self, mock_client_class, workout_sync_service, db_session):
         """Test that duplicate activities are not synced again."""
         # First, create an existing workout
-        existing_workout = Workout(
-            garmin_activity_id='12345',
-            activity_type='cycling',
-            start_time=datetime.now(),
-            duration_seconds=3600.0,
-            distance_m=25000.0
-        )
-        db_session.add(existing_workout)
+        await db_session.execute(insert(Workout), [{
+            'garmin_activity_id': '12345',
+            'activity_type': 'cycling',
+            'start_time': datetime(2024, 1, 15, 8, 0, 0),
+            'duration_seconds': 3600.0,
+            'distance_m': 25000.0
+        }])
         await db_session.commit()
 
         # Setup mock Garmin client
-        mock_client = MagicMock()
-        mock_client.login = AsyncMock(return_value=True)
-        mock_client.save = MagicMock()
+        mock_client = _GarminStub()
 
         # Mock activity data (same as existing)
-        mock_activities = [
-            {
-                'activityId': '12345',
-                'startTimeLocal': '2024-01-15T08:00:00.000Z',
-                'activityType': {'typeKey': 'cycling'},
-                'duration': 3600.0,
-                'distance': 25000.0
-            }
-        ]
-
-        mock_client.get_activities_by_date = MagicMock(return_value=mock_activities)
+        mock_activities = [dict(_CYCLING_ACTIVITY)]
+
+        mock_client.get_activities_by_date.return_value = mock_activities
         mock_client_class.return_value = mock_client
 
         # Test sync
@@ -205,16 +209,12 @@ class TestWorkoutSyncing:
 
         assert synced_count == 0  # No new activities synced
 
-    @patch.dict(os.environ, {
-        'GARMIN_USERNAME': 'invalid@example.com',
-        'GARMIN_PASSWORD': 'wrongpass'
-    })
-    @patch('garminconnect.Garmin')
+    @patch('backend.app.services.garmin._client_factory')
     async def test_sync_with_auth_failure(self, mock_client_class, workout_sync_service, db_session):
         """Test sync failure due to authentication error."""
-        # Setup mock client to fail authentication
-        mock_client = MagicMock()
-        mock_client.login = AsyncMock(side_effect=Exception("Invalid credentials"))
+        # Setup mock client to fail authentication: no saved session, bad credentials
+        mock_client = _GarminStub()
+        mock_client.login.side_effect = [FileNotFoundError, Exception("Invalid credentials")]
         mock_client_class.return_value = mock_client
 
         # Test sync
@@ -222,25 +222,17 @@ class TestWorkoutSyncing:
             await workout_sync_service.sync_recent_activities(days_back=7)
 
         # Verify sync log shows failure
-        sync_log_result = await db_session.execute(
-            select(GarminSyncLog).order_by(GarminSyncLog.created_at.desc())
-        )
+        sync_log_result = await db_session.execute(_SELECT_SYNC_LOGS_DESC)
         sync_log = sync_log_result.scalar_one_or_none()
         assert sync_log is not None
-        assert sync_log.status == 'auth_error'
+        assert sync_log.status == GarminSyncStatus.AUTH_FAILED
 
-    @patch.dict(os.environ, {
-        'GARMIN_USERNAME': 'test@example.com',
-        'GARMIN_PASSWORD': 'testpass123'
-    })
-    @patch('garminconnect.Garmin')
+    @patch('backend.app.services.garmin._client_factory')
     async def test_sync_with_api_error(self, mock_client_class, workout_sync_service, db_session):
         """Test sync failure due to API error."""
         # Setup mock client
-        mock_client = MagicMock()
-        mock_client.login = AsyncMock(return_value=True)
-        mock_client.save = MagicMock()
-        mock_client.get_activities_by_date = MagicMock(side_effect=Exception("API rate limit exceeded"))
+        mock_client = _GarminStub()
+        mock_client.get_activities_by_date.side_effect = Exception("API rate limit exceeded")
         mock_client_class.return_value = mock_client
 
         # Test sync
@@ -248,55 +240,28 @@ class TestWorkoutSyncing:
             await workout_sync_service.sync_recent_activities(days_back=7)
 
         # Verify sync log shows API error
-        sync_log_result = await db_session.execute(
-            select(GarminSyncLog).order_by(GarminSyncLog.created_at.desc())
-        )
+        sync_log_result = await db_session.execute(_SELECT_SYNC_LOGS_DESC)
         sync_log = sync_log_result.scalar_one_or_none()
         assert sync_log is not None
-        assert sync_log.status == 'api_error'
+        assert sync_log.status == GarminSyncStatus.FAILED
         assert 'API rate limit' in sync_log.error_message
 
 
 class TestErrorHandling:
     """Test error handling in Garmin integration."""
 
-    @patch.dict(os.environ, {
-        'GARMIN_USERNAME': 'test@example.com',
-        'GARMIN_PASSWORD': 'testpass123'
-    })
-    @patch('garminconnect.Garmin')
+    @patch('backend.app.services.garmin._client_factory')
     async def test_activity_detail_fetch_retry(self, mock_client_class, workout_sync_service, db_session):
         """Test retry logic when fetching activity details fails."""
         # Setup mock client
-        mock_client = MagicMock()
-        mock_client.login = AsyncMock(return_value=True)
-        mock_client.save = MagicMock()
-
-        mock_activities = [
-            {
-                'activityId': '12345',
-                'startTimeLocal': '2024-01-15T08:00:00.000Z',
-                'activityType': {'typeKey': 'cycling'},
-                'duration': 3600.0,
-                'distance': 25000.0
-            }
-        ]
-
-        mock_client.get_activities_by_date = MagicMock(return_value=mock_activities)
+        mock_client = _GarminStub()
+
+        mock_activities = [dict(_CYCLING_ACTIVITY)]
+
+        mock_client.get_activities_by_date.return_value = mock_activities
         # First two calls fail, third succeeds
-        mock_client.get_activity_details = MagicMock(side_effect=[
-            Exception("Temporary error"),
-            Exception("Temporary error"),
-            {
-                'activityId': '12345',
-                'startTimeLocal': '2024-01-15T08:00:00.000Z',
-                'activityType': {'typeKey': 'cycling'},
-                'duration': 3600.0,
-                'distance': 25000.0,
-                'averageHR': 140.0,
-                'maxHR': 170.0
-            }
-        ])
+        get_details, calls = make_flaky(2, dict(_CYCLING_ACTIVITY, averageHR=140.0, maxHR=170.0))
+        mock_client.get_activity_details = get_details
         mock_client_class.return_value = mock_client
 
         # Test sync
@@ -304,4 +269,4 @@ class TestErrorHandling:
 
         assert synced_count == 1
         # Verify get_activity was called 3 times (initial + 2 retries)
-        assert mock_client.get_activity_details.call_count == 3
\ No newline at end of file
+        assert calls["n"] == 3
\ No newline at end of file
@@ -1,92 +1,154 @@
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.pool import StaticPool
-from sqlalchemy import select
-from backend.app.database import Base
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy import event, func, insert, select
+from backend.app.database import Base, JSON_OPTIONS
 from backend.app.services.workout_sync import WorkoutSyncService
 from backend.app.services.garmin import GarminConnectService as GarminService, GarminAPIError, GarminAuthError
 from backend.app.models.workout import Workout
 from backend.app.models.garmin_sync_log import GarminSyncLog, GarminSyncStatus
 from datetime import datetime, timedelta
+from freezegun import freeze_time
+import asyncio
+from contextlib import nullcontext
 import os
-from dotenv import load_dotenv
-from backend.app.config import Settings
+
+# Frozen clock for tests that depend on the sync window
+NOW = datetime(2024, 6, 1, 12, 0, 0)
+
+# Activity start times, n days before NOW
+_TS_D1 = "2024-05-31T12:00:00"
+_TS_D2 = "2024-05-30T12:00:00"
+_TS_D3 = "2024-05-29T12:00:00"
+_TS_D4 = "2024-05-28T12:00:00"
+_TS_D5 = "2024-05-27T12:00:00"
+
+# Assertion queries, built once and reused by every test
+_SELECT_WORKOUTS = select(Workout)
+_COUNT_WORKOUTS = select(func.count()).select_from(Workout)
+_SELECT_SYNC_LOGS = select(GarminSyncLog).order_by(GarminSyncLog.id)
+_SELECT_SYNC_LOGS_DESC = select(GarminSyncLog).order_by(GarminSyncLog.id.desc())
 
 # --- Completely Rewritten Fixtures ---
 
-@pytest.fixture(scope="function")
+# One named in-memory database per pytest-xdist worker, so `pytest -n auto`
+# workers never share tables
+WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+TEST_DATABASE_URL = f"sqlite+aiosqlite:///file:garmin_{WORKER_ID}?mode=memory&cache=shared&uri=true"
+
+# asyncio.sleep is patched for every test; keep the real one for tests that
+# need to yield to the event loop.
+_real_sleep = asyncio.sleep
+
+# Module-scoped async fixtures run on the module's event loop, so the tests
+# that use them must share it.
+pytestmark = pytest.mark.asyncio(scope="module")
+
+@pytest.fixture(scope="module")
 def test_engine():
-    """Create a test engine for each test function."""
+    """Create a test engine shared by every test in this module."""
     engine = create_async_engine(
-        "sqlite+aiosqlite:///:memory:",
+        TEST_DATABASE_URL,
         echo=False,
-        poolclass=StaticPool,
+        # Pooled connections all see the shared-cache database, which lives
+        # as long as one of them stays open
+        poolclass=AsyncAdaptedQueuePool,
         connect_args={"check_same_thread": False},
+        **JSON_OPTIONS,
     )
+
+    # pysqlite defers BEGIN, which breaks SAVEPOINT handling; emit it ourselves
+    @event.listens_for(engine.sync_engine, "connect")
+    def do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     return engine
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="module")
 async def setup_database(test_engine):
-    """Set up the database schema."""
+    """Set up the database schema once for the module."""
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
     await test_engine.dispose()
 
 @pytest.fixture
 async def db_session(test_engine, setup_database):
-    """Create a database session for testing."""
-    async_session_factory = async_sessionmaker(
-        bind=test_engine,
-        class_=AsyncSession,
-        expire_on_commit=False
-    )
-    
-    session = async_session_factory()
-    yield session
-    await session.close()
+    """Create a database session whose work is rolled back after the test.
+
+    Commits made by the code under test only release a SAVEPOINT; the outer
+    transaction is rolled back so every test starts from an empty schema.
+    """
+    async with test_engine.connect() as conn, conn.begin() as trans:
+        async with AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        ) as session:
+            yield session
+        await trans.rollback()
+
+@pytest.fixture(autouse=True)
+def mock_sleep(no_sleep):
+    """Skip the real retry backoff; tests can inspect the requested delays."""
+    return no_sleep
+
+# Building a spec'd mock introspects GarminService, so build it once and reset it per test
+_GARMIN_MOCK_TEMPLATE = MagicMock(spec=GarminService)
 
 @pytest.fixture
 def mock_garmin_service():
     """Mock the GarminService for testing."""
-    mock_service = MagicMock(spec=GarminService)
-    mock_service.authenticate = AsyncMock(return_value=True)
-    mock_service.get_activities = AsyncMock(return_value=[])
-    mock_service.get_activity_details = AsyncMock(return_value={})
+    mock_service = _GARMIN_MOCK_TEMPLATE
+    mock_service.reset_mock(return_value=True, side_effect=True)
+    for name, default in (("authenticate", True), ("get_activities", []), ("get_activity_details", {})):
+        method = getattr(mock_service, name)
+        if not isinstance(method, AsyncMock):  # replaced by a previous test
+            method = AsyncMock()
+            setattr(mock_service, name, method)
+        method.return_value = default
     return mock_service
 
 @pytest.fixture
-def settings() -> Settings:
-   """Load settings from .env file."""
-   load_dotenv()
-   return Settings()
+def workout_sync_service(db_session: AsyncSession, mock_garmin_service: MagicMock) -> WorkoutSyncService:
+    """WorkoutSyncService bound to the test session, talking to the mocked Garmin service."""
+    service = WorkoutSyncService(db=db_session)
+    service.garmin_service = mock_garmin_service
+    return service
+
+def make_flaky(fail_n, then, message="Temporary error"):
+    """Async stand-in for get_activity_details that fails fail_n times, then returns then."""
+    calls = {"n": 0}
+
+    async def get_details(activity_id):
+        calls["n"] += 1
+        if calls["n"] <= fail_n:
+            raise GarminAPIError(message)
+        return then
+
+    return get_details, calls
 
 @pytest.fixture
-def real_garmin_service(settings: Settings) -> GarminService:
-   """Return a real GarminService instance with credentials from settings."""
-   if not settings.GARMIN_USERNAME or not settings.GARMIN_PASSWORD:
-       pytest.skip("GARMIN_USERNAME and GARMIN_PASSWORD must be set in .env for functional tests.")
+def real_garmin_service() -> GarminService:
+   """Return a real GarminService instance using the credentials from the environment."""
    return GarminService()
 
 # --- Test Cases ---
 
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_successful_sync_functional(db_session: AsyncSession, mock_garmin_service: MagicMock):
+async def test_successful_sync_functional(db_session: AsyncSession, mock_garmin_service: MagicMock, workout_sync_service: WorkoutSyncService):
     """Test successful synchronization of recent activities."""
-    # Create service with the actual session
-    service = WorkoutSyncService(db=db_session)
-    service.garmin_service = mock_garmin_service
-    
     # Arrange
     mock_garmin_service.get_activities.return_value = [
         {
             'activityId': '1001',
             'activityType': {'typeKey': 'cycling'},
-            'startTimeLocal': (datetime.now() - timedelta(days=1)).isoformat(),
+            'startTimeLocal': _TS_D1,
             'duration': 3600,
             'distance': 50000,
             'averageHR': 150,
@@ -102,13 +164,13 @@ async def test_successful_sync_functional(db_session: AsyncSession, mock_garmin_
     }
 
     # Act
-    synced_count = await service.sync_recent_activities(days_back=7)
+    synced_count = await workout_sync_service.sync_recent_activities(days_back=7)
 
     # Assert
     assert synced_count == 1
     
     # Verify workout in DB
-    result = await db_session.execute(select(Workout))
+    result = await db_session.execute(_SELECT_WORKOUTS)
     workouts = result.scalars().all()
     assert len(workouts) == 1
     assert workouts[0].garmin_activity_id == '1001'
@@ -117,206 +179,153 @@ async def test_successful_sync_functional(db_session: AsyncSession, mock_garmin_
     assert 'temperature' in workouts[0].metrics
 
     # Verify sync log in DB
-    result = await db_session.execute(select(GarminSyncLog))
+    result = await db_session.execute(_SELECT_SYNC_LOGS)
     sync_logs = result.scalars().all()
     assert len(sync_logs) == 1
     assert sync_logs[0].status == GarminSyncStatus.COMPLETED
     assert sync_logs[0].activities_synced == 1
     assert sync_logs[0].error_message is None
 
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_sync_with_no_new_activities(db_session: AsyncSession, mock_garmin_service: MagicMock):
-    """Test synchronization when no new activities are found."""
-    # Create service with the actual session
-    service = WorkoutSyncService(db=db_session)
-    service.garmin_service = mock_garmin_service
-    
-    # Arrange
-    mock_garmin_service.get_activities.return_value = []  # No activities
+    latest = await workout_sync_service.get_latest_sync_status()
+    assert latest.status == GarminSyncStatus.COMPLETED
+    assert latest.activities_synced == 1
 
-    # Act
-    synced_count = await service.sync_recent_activities(days_back=7)
-
-    # Assert
-    assert synced_count == 0
-    result = await db_session.execute(select(Workout))
-    workouts = result.scalars().all()
-    assert len(workouts) == 0
-    
-    result = await db_session.execute(select(GarminSyncLog))
-    sync_logs = result.scalars().all()
-    assert len(sync_logs) == 1
-    assert sync_logs[0].status == GarminSyncStatus.COMPLETED
-    assert sync_logs[0].activities_synced == 0
+SYNC_WITHOUT_WORKOUTS_CASES = [
+    pytest.param(None, GarminSyncStatus.COMPLETED, None, id="no_new_activities"),
+    pytest.param(GarminAuthError("Invalid credentials"), GarminSyncStatus.AUTH_FAILED, "Invalid credentials", id="auth_error"),
+    pytest.param(GarminAPIError("Garmin service unavailable"), GarminSyncStatus.FAILED, "Garmin service unavailable", id="api_error"),
+]
 
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_sync_with_authentication_error(db_session: AsyncSession, mock_garmin_service: MagicMock):
-    """Test synchronization failure due to Garmin authentication error."""
-    # Create service with the actual session
-    service = WorkoutSyncService(db=db_session)
-    service.garmin_service = mock_garmin_service
-    
+@pytest.mark.parametrize("error, expected_status, expected_message", SYNC_WITHOUT_WORKOUTS_CASES)
+async def test_sync_without_new_workouts(db_session: AsyncSession, mock_garmin_service: MagicMock, workout_sync_service: WorkoutSyncService,
+                                         error, expected_status, expected_message):
+    """Test the sync log left by a sync that finds nothing new or fails to list activities."""
     # Arrange
-    mock_garmin_service.get_activities.side_effect = GarminAuthError("Invalid credentials")
-
-    # Act & Assert
-    with pytest.raises(GarminAuthError):
-        await service.sync_recent_activities(days_back=7)
+    mock_garmin_service.get_activities.side_effect = error
 
-    # Verify sync log in DB
-    result = await db_session.execute(select(GarminSyncLog))
-    sync_logs = result.scalars().all()
-    assert len(sync_logs) == 1
-    assert sync_logs[0].status == GarminSyncStatus.AUTH_FAILED
-    assert "Invalid credentials" in sync_logs[0].error_message
-
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_sync_with_api_error(db_session: AsyncSession, mock_garmin_service: MagicMock):
-    """Test synchronization failure due to general Garmin API error."""
-    # Create service with the actual session
-    service = WorkoutSyncService(db=db_session)
-    service.garmin_service = mock_garmin_service
-    
-    # Arrange
-    mock_garmin_service.get_activities.side_effect = GarminAPIError("Garmin service unavailable")
+    # Act
+    with pytest.raises(type(error)) if error else nullcontext():
+        synced_count = await workout_sync_service.sync_recent_activities(days_back=7)
 
-    # Act & Assert
-    with pytest.raises(GarminAPIError):
-        await service.sync_recent_activities(days_back=7)
+    # Assert
+    if error is None:
+        assert synced_count == 0
+    assert await db_session.scalar(_COUNT_WORKOUTS) == 0
 
-    # Verify sync log in DB
-    result = await db_session.execute(select(GarminSyncLog))
+    result = await db_session.execute(_SELECT_SYNC_LOGS)
     sync_logs = result.scalars().all()
     assert len(sync_logs) == 1
-    assert sync_logs[0].status == GarminSyncStatus.FAILED
-    assert "Garmin service unavailable" in sync_logs[0].error_message
+    assert sync_logs[0].status == expected_status
+    if expected_message is None:
+        assert sync_logs[0].activities_synced == 0
+    else:
+        assert expected_message in sync_logs[0].error_message
 
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_sync_with_activity_details_retry_success(db_session: AsyncSession, mock_garmin_service: MagicMock):
+@freeze_time(NOW, real_asyncio=True)
+async def test_sync_with_activity_details_retry_success(db_session: AsyncSession, mock_garmin_service: MagicMock, workout_sync_service: WorkoutSyncService, mock_sleep: AsyncMock):
     """Test successful retry of activity details fetch after initial failure."""
-    # Create service with the actual session
-    service = WorkoutSyncService(db=db_session)
-    service.garmin_service = mock_garmin_service
-    
     # Arrange
     mock_garmin_service.get_activities.return_value = [
         {
             'activityId': '1002',
             'activityType': {'typeKey': 'running'},
-            'startTimeLocal': (datetime.now() - timedelta(days=2)).isoformat(),
+            'startTimeLocal': _TS_D2,
             'duration': 3000,
             'distance': 10000
         }
     ]
     # First call to get_activity_details fails, second succeeds
-    mock_garmin_service.get_activity_details.side_effect = [
-        GarminAPIError("Temporary network issue"),
-        {'averageHR': 160, 'maxHR': 190}
-    ]
+    get_details, calls = make_flaky(1, {'averageHR': 160, 'maxHR': 190}, "Temporary network issue")
+    mock_garmin_service.get_activity_details = get_details
 
     # Act
-    # Mock asyncio.sleep to avoid actual delays during tests
-    with patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
-        synced_count = await service.sync_recent_activities(days_back=7)
-        mock_sleep.assert_awaited_with(1)  # First retry delay
+    synced_count = await workout_sync_service.sync_recent_activities(days_back=7)
+    mock_sleep.assert_awaited_once()
+    assert 1 <= mock_sleep.await_args[0][0] <= 2  # First retry delay plus jitter
 
     # Assert
     assert synced_count == 1
-    result = await db_session.execute(select(Workout))
+    result = await db_session.execute(_SELECT_WORKOUTS)
     workouts = result.scalars().all()
     assert len(workouts) == 1
     assert workouts[0].garmin_activity_id == '1002'
     assert workouts[0].avg_hr == 160
-    assert mock_garmin_service.get_activity_details.call_count == 2
+    assert calls["n"] == 2
     
-    result = await db_session.execute(select(GarminSyncLog))
+    result = await db_session.execute(_SELECT_SYNC_LOGS)
     sync_logs = result.scalars().all()
     assert len(sync_logs) == 1
     assert sync_logs[0].status == GarminSyncStatus.COMPLETED
 
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_sync_with_activity_details_retry_failure(db_session: AsyncSession, mock_garmin_service: MagicMock):
+@freeze_time(NOW, real_asyncio=True)
+async def test_sync_with_activity_details_retry_failure(db_session: AsyncSession, mock_garmin_service: MagicMock, workout_sync_service: WorkoutSyncService, mock_sleep: AsyncMock):
     """Test activity details fetch eventually fails after multiple retries."""
-    # Create service with the actual session
-    service = WorkoutSyncService(db=db_session)
-    service.garmin_service = mock_garmin_service
-    
     # Arrange
     mock_garmin_service.get_activities.return_value = [
         {
             'activityId': '1003',
             'activityType': {'typeKey': 'swimming'},
-            'startTimeLocal': (datetime.now() - timedelta(days=3)).isoformat(),
+            'startTimeLocal': _TS_D3,
             'duration': 2000,
             'distance': 2000
         }
     ]
     # All calls to get_activity_details fail
-    mock_garmin_service.get_activity_details.side_effect = [
-        GarminAPIError("Service unavailable"),
-        GarminAPIError("Service unavailable"),
-        GarminAPIError("Service unavailable")
-    ]
+    get_details, calls = make_flaky(3, None, "Service unavailable")
+    mock_garmin_service.get_activity_details = get_details
 
     # Act & Assert
-    with pytest.raises(GarminAPIError), \
-         patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
-        await service.sync_recent_activities(days_back=7)
-        assert mock_garmin_service.get_activity_details.call_count == 3
-        mock_sleep.assert_awaited_with(4)  # Last retry delay (2**(3-1))
+    with pytest.raises(GarminAPIError):
+        await workout_sync_service.sync_recent_activities(days_back=7)
+    assert calls["n"] == 3
+    delays = [call.args[0] for call in mock_sleep.await_args_list]
+    assert len(delays) == 2  # No sleep after the final attempt
+    assert 1 <= delays[0] <= 2 and 2 <= delays[1] <= 3  # 2**attempt plus jitter
 
     # Verify sync log in DB
-    result = await db_session.execute(select(GarminSyncLog))
+    result = await db_session.execute(_SELECT_SYNC_LOGS)
     sync_logs = result.scalars().all()
     assert len(sync_logs) == 1
     assert sync_logs[0].status == GarminSyncStatus.FAILED
     assert "Service unavailable" in sync_logs[0].error_message
     
     # No workout should be saved
-    result = await db_session.execute(select(Workout))
-    workouts = result.scalars().all()
-    assert len(workouts) == 0
+    assert await db_session.scalar(_COUNT_WORKOUTS) == 0
 
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_sync_with_duplicate_activities_in_garmin_feed(db_session: AsyncSession, mock_garmin_service: MagicMock):
+@freeze_time(NOW, real_asyncio=True)
+async def test_sync_with_duplicate_activities_in_garmin_feed(db_session: AsyncSession, mock_garmin_service: MagicMock, workout_sync_service: WorkoutSyncService):
     """Test handling of duplicate activities appearing in the Garmin feed."""
-    # Create service with the actual session
-    service = WorkoutSyncService(db=db_session)
-    service.garmin_service = mock_garmin_service
-    
     # Arrange
     # First sync: add activity 1004
     mock_garmin_service.get_activities.return_value = [
         {
             'activityId': '1004',
             'activityType': {'typeKey': 'cycling'},
-            'startTimeLocal': (datetime.now() - timedelta(days=4)).isoformat(),
+            'startTimeLocal': _TS_D4,
             'duration': 4000,
             'distance': 60000
         }
     ]
     mock_garmin_service.get_activity_details.return_value = {'averageHR': 140}
-    await service.sync_recent_activities(days_back=7)
+    await workout_sync_service.sync_recent_activities(days_back=7)
 
     # Second sync: activity 1004 is present again, plus a new activity 1005
     mock_garmin_service.get_activities.return_value = [
         {
             'activityId': '1004',
             'activityType': {'typeKey': 'cycling'},
-            'startTimeLocal': (datetime.now() - timedelta(days=4)).isoformat(),
+            'startTimeLocal': _TS_D4,
             'duration': 4000,
             'distance': 60000
         },
         {
             'activityId': '1005',
             'activityType': {'typeKey': 'running'},
-            'startTimeLocal': (datetime.now() - timedelta(days=5)).isoformat(),
+            'startTimeLocal': _TS_D5,
             'duration': 2500,
             'distance': 5000
         }
@@ -324,23 +333,84 @@ async def test_sync_with_duplicate_activities_in_garmin_feed(db_session: AsyncSe
     mock_garmin_service.get_activity_details.return_value = {'averageHR': 130}  # for activity 1005
 
     # Act
-    synced_count = await service.sync_recent_activities(days_back=7)
+    synced_count = await workout_sync_service.sync_recent_activities(days_back=7)
 
     # Assert
     assert synced_count == 1  # Only 1005 should be synced
-    result = await db_session.execute(select(Workout))
+    result = await db_session.execute(_SELECT_WORKOUTS)
     workouts = result.scalars().all()
     assert len(workouts) == 2
     assert any(w.garmin_activity_id == '1004' for w in workouts)
     assert any(w.garmin_activity_id == '1005' for w in workouts)
     
-    result = await db_session.execute(select(GarminSyncLog))
+    result = await db_session.execute(_SELECT_SYNC_LOGS)
     sync_logs = result.scalars().all()
     assert len(sync_logs) == 2
     assert sync_logs[1].activities_synced == 1  # Second log should show 1 activity synced
+    assert sync_logs[1].last_sync_time == NOW
+
+@pytest.mark.unit
+async def test_sync_fetches_activity_details_concurrently(db_session: AsyncSession, mock_garmin_service: MagicMock, workout_sync_service: WorkoutSyncService):
+    """Test that activity details are fetched concurrently, bounded by max_concurrent_fetches."""
+    workout_sync_service.max_concurrent_fetches = 3
+
+    # Arrange
+    mock_garmin_service.get_activities.return_value = [
+        {
+            'activityId': str(2000 + i),
+            'activityType': {'typeKey': 'cycling'},
+            'startTimeLocal': _TS_D1,
+            'duration': 3600,
+            'distance': 30000
+        }
+        for i in range(10)
+    ]
+    in_flight = 0
+    max_in_flight = 0
+
+    async def get_details(activity_id):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await _real_sleep(0.01)
+        in_flight -= 1
+        return {'averageHR': 150}
+
+    mock_garmin_service.get_activity_details.side_effect = get_details
+
+    # Act
+    synced_count = await workout_sync_service.sync_recent_activities(days_back=7)
+
+    # Assert
+    assert synced_count == 10
+    assert max_in_flight == 3
+    assert await db_session.scalar(_COUNT_WORKOUTS) == 10
+
+@pytest.mark.unit
+async def test_insert_workouts_skips_existing_activities(db_session: AsyncSession):
+    """Test that inserting a workout that already exists is skipped rather than failing."""
+    service = WorkoutSyncService(db=db_session)
+    start_time = NOW - timedelta(days=1)
+    await db_session.execute(insert(Workout), [{'garmin_activity_id': '3000', 'start_time': start_time}])
+    await db_session.commit()
+
+    # Act
+    inserted = await service.insert_workouts([
+        {'garmin_activity_id': '3000', 'start_time': start_time},
+        {'garmin_activity_id': '3001', 'start_time': start_time},
+    ])
+    await db_session.commit()
+
+    # Assert
+    assert inserted == 1
+    result = await db_session.execute(select(Workout.garmin_activity_id))
+    assert sorted(result.scalars().all()) == ['3000', '3001']
 
 @pytest.mark.functional
-@pytest.mark.asyncio
+@pytest.mark.skipif(
+    not (os.getenv("GARMIN_USERNAME") and os.getenv("GARMIN_PASSWORD")),
+    reason="GARMIN_USERNAME and GARMIN_PASSWORD must be set in .env for functional tests.",
+)
 async def test_garmin_sync_with_real_creds(db_session: AsyncSession, real_garmin_service: GarminService):
    """
    Test a real Garmin sync. This is a functional test that makes a live API call.
@@ -358,7 +428,7 @@ async def test_garmin_sync_with_real_creds(db_session: AsyncSession, real_garmin
    assert synced_count >= 0  # We can't know the exact count, but it should not fail
 
    # Verify sync log in DB
-   result = await db_session.execute(select(GarminSyncLog).order_by(GarminSyncLog.id.desc()))
+   result = await db_session.execute(_SELECT_SYNC_LOGS_DESC)
    latest_log = result.scalars().first()
    
    assert latest_log is not None
@@ -1,29 +1,24 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
-from backend.app.services.workout_sync import WorkoutSyncService
+from unittest.mock import AsyncMock
 from backend.app.services.garmin import GarminAPIError, GarminAuthError
 from backend.app.models.workout import Workout
-from backend.app.models.garmin_sync_log import GarminSyncLog
-from datetime import datetime, timedelta
+from backend.app.models.garmin_sync_log import GarminSyncLog, GarminSyncStatus
+from backend.app.services.retry import retry_async
+from datetime import datetime, timedelta, timezone
 import asyncio
 
+from backend.tests.services._fakes import FakeResult
+
 @pytest.mark.asyncio
-async def test_successful_sync():
+async def test_successful_sync(sync_service):
     """Test successful sync of new activities"""
-    # Create proper async mock for database session
-    mock_db = AsyncMock()
-    mock_db.add = MagicMock() # add is synchronous
-    mock_db.commit = AsyncMock()
-    mock_db.refresh = AsyncMock()
-    
-    # Mock the activity_exists check to return False (no duplicates)
-    mock_db.execute = AsyncMock()
-    mock_db.execute.return_value.scalar_one_or_none = AsyncMock(return_value=None)
-    
-    service = WorkoutSyncService(mock_db)
+    service, mock_db, mock_garmin = sync_service
+
+    # No existing activities (no duplicates); rowcount is the rows inserted by the upsert
+    mock_db.execute = AsyncMock(return_value=FakeResult(rows=[], rowcount=1))
     
     # Mock the garmin service methods
-    service.garmin_service.get_activities = AsyncMock(return_value=[
+    mock_garmin.get_activities.return_value = [
         {
             'activityId': '123456',
             'activityType': {'typeKey': 'cycling'},
@@ -31,92 +26,79 @@ async def test_successful_sync():
             'duration': 3600,
             'distance': 25000
         }
-    ])
+    ]
     
-    service.garmin_service.get_activity_details = AsyncMock(return_value={
+    mock_garmin.get_activity_details.return_value = {
         'averageHR': 150,
         'maxHR': 180,
         'avgPower': 250,
         'elevationGain': 500
-    })
+    }
     
     result = await service.sync_recent_activities(days_back=7)
     
     assert result == 1
-    assert mock_db.add.call_count >= 2  # sync_log and workout
+    mock_db.add.assert_called_once()  # sync_log
+    insert_stmt = mock_db.execute.await_args[0][0]
+    assert insert_stmt.table.name == Workout.__tablename__
     mock_db.commit.assert_awaited()
 
 @pytest.mark.asyncio
-async def test_duplicate_activity_handling():
+async def test_duplicate_activity_handling(sync_service):
     """Test skipping duplicate activities"""
-    mock_db = AsyncMock()
-    mock_db.add = MagicMock()
-    mock_db.commit = AsyncMock()
-    mock_db.refresh = AsyncMock()
-    
-    service = WorkoutSyncService(mock_db)
+    service, mock_db, mock_garmin = sync_service
     
-    # Mock activity_exists to return True (activity exists)
-    service.activity_exists = AsyncMock(return_value=True)
+    # Mock get_existing_activity_ids to report the activity as existing
+    service.get_existing_activity_ids = AsyncMock(return_value={'123456'})
     
-    service.garmin_service.get_activities = AsyncMock(return_value=[
+    mock_garmin.get_activities.return_value = [
         {'activityId': '123456', 'startTimeLocal': '2024-01-15T08:00:00Z'}
-    ])
+    ]
     
     result = await service.sync_recent_activities()
     
     assert result == 0 # No new activities synced
+    service.get_existing_activity_ids.assert_awaited_once_with(['123456'])
     mock_db.commit.assert_awaited()
 
 @pytest.mark.asyncio
-async def test_activity_detail_retry_logic():
+async def test_activity_detail_retry_logic(sync_service):
     """Test retry logic for activity details"""
-    mock_db = AsyncMock()
-    mock_db.add = MagicMock()
-    mock_db.commit = AsyncMock()
-    mock_db.refresh = AsyncMock()
+    service, mock_db, mock_garmin = sync_service
+    service.retry_base_delay = 0  # retry immediately
+    service.retry_jitter = 0
+    mock_db.execute.return_value = FakeResult(rowcount=1)
     
-    service = WorkoutSyncService(mock_db)
-    service.activity_exists = AsyncMock(return_value=False)
+    service.get_existing_activity_ids = AsyncMock(return_value=set())
     
-    service.garmin_service.get_activities = AsyncMock(return_value=[
+    mock_garmin.get_activities.return_value = [
         {
             'activityId': '123456',
             'activityType': {'typeKey': 'cycling'},
             'startTimeLocal': '2024-01-15T08:00:00Z',
             'duration': 3600
         }
-    ])
+    ]
     
     # First call fails, second succeeds
-    service.garmin_service.get_activity_details = AsyncMock(
-        side_effect=[
-            GarminAPIError("Temporary failure"),
-            {'averageHR': 150, 'maxHR': 180}
-        ]
-    )
+    mock_garmin.get_activity_details.side_effect = [
+        GarminAPIError("Temporary failure"),
+        {'averageHR': 150, 'maxHR': 180}
+    ]
     
-    # Mock asyncio.sleep to avoid actual delays in tests
-    with patch('asyncio.sleep', new_callable=AsyncMock):
-        result = await service.sync_recent_activities()
+    result = await service.sync_recent_activities()
     
-    assert service.garmin_service.get_activity_details.call_count == 2
+    assert mock_garmin.get_activity_details.call_count == 2
     assert result == 1
+    service.get_existing_activity_ids.assert_awaited_once_with(['123456'])
 
 @pytest.mark.asyncio
-async def test_auth_error_handling():
+async def test_auth_error_handling(sync_service):
     """Test authentication error handling"""
-    mock_db = AsyncMock()
-    mock_db.add = MagicMock()
-    mock_db.commit = AsyncMock()
-    mock_db.refresh = AsyncMock()
-    
-    service = WorkoutSyncService(mock_db)
+    service, mock_db, mock_garmin = sync_service
     
     # Mock authentication failure
-    service.garmin_service.get_activities = AsyncMock(
-        side_effect=GarminAuthError("Authentication failed")
-    )
+    mock_garmin.get_activities.side_effect = GarminAuthError("Authentication failed")
     
     with pytest.raises(GarminAuthError):
         await service.sync_recent_activities()
@@ -126,21 +108,14 @@ async def test_auth_error_handling():
                      if isinstance(call[0][0], GarminSyncLog)]
     assert len(sync_log_calls) >= 1
     sync_log = sync_log_calls[0][0][0]
-    assert sync_log.status == "auth_error"
+    assert sync_log.status == GarminSyncStatus.AUTH_FAILED
 
 @pytest.mark.asyncio
-async def test_api_error_handling():
+async def test_api_error_handling(sync_service):
     """Test API error handling"""
-    mock_db = AsyncMock()
-    mock_db.add = MagicMock()
-    mock_db.commit = AsyncMock()
-    mock_db.refresh = AsyncMock()
+    service, mock_db, mock_garmin = sync_service
     
-    service = WorkoutSyncService(mock_db)
-    
-    service.garmin_service.get_activities = AsyncMock(
-        side_effect=GarminAPIError("API rate limit exceeded")
-    )
+    mock_garmin.get_activities.side_effect = GarminAPIError("API rate limit exceeded")
     
     with pytest.raises(GarminAPIError):
         await service.sync_recent_activities()
@@ -149,13 +124,13 @@ async def test_api_error_handling():
     sync_log_calls = [call for call in mock_db.add.call_args_list 
                      if isinstance(call[0][0], GarminSyncLog)]
     sync_log = sync_log_calls[0][0][0]
-    assert sync_log.status == "api_error"
+    assert sync_log.status == GarminSyncStatus.FAILED
     assert "rate limit" in sync_log.error_message.lower()
 
 @pytest.mark.asyncio
-async def test_get_sync_status():
+async def test_get_sync_status(sync_service):
     """Test retrieval of latest sync status"""
-    mock_db = AsyncMock()
+    service, mock_db, _ = sync_service
     mock_log = GarminSyncLog(
         status="success", 
         activities_synced=5,
@@ -163,11 +138,8 @@ async def test_get_sync_status():
     )
     
     # Mock the database query
-    mock_result = AsyncMock()
-    mock_result.scalar_one_or_none = AsyncMock(return_value=mock_log)
-    mock_db.execute = AsyncMock(return_value=mock_result)
+    mock_db.execute = AsyncMock(return_value=FakeResult(mock_log))
     
-    service = WorkoutSyncService(mock_db)
     result = await service.get_latest_sync_status()
     
     assert result.status == "success"
@@ -175,42 +147,34 @@ async def test_get_sync_status():
     mock_db.execute.assert_awaited_once()
 
 @pytest.mark.asyncio
-async def test_activity_exists_check():
+async def test_activity_exists_check(sync_service):
     """Test the activity_exists helper method"""
-    mock_db = AsyncMock()
+    service, mock_db, _ = sync_service
     
     # Mock existing activity
-    mock_workout = Workout(garmin_activity_id="123456")
-    mock_result = AsyncMock()
-    mock_result.scalar_one_or_none = AsyncMock(return_value=mock_workout)
-    mock_db.execute = AsyncMock(return_value=mock_result)
+    mock_db.execute = AsyncMock(return_value=FakeResult(1))
     
-    service = WorkoutSyncService(mock_db)
     exists = await service.activity_exists("123456")
     
     assert exists is True
     mock_db.execute.assert_awaited_once()
 
 @pytest.mark.asyncio
-async def test_activity_does_not_exist():
+async def test_activity_does_not_exist(sync_service):
     """Test activity_exists when activity doesn't exist"""
-    mock_db = AsyncMock()
+    service, mock_db, _ = sync_service
     
     # Mock no existing activity
-    mock_result = AsyncMock()
-    mock_result.scalar_one_or_none = AsyncMock(return_value=None)
-    mock_db.execute = AsyncMock(return_value=mock_result)
+    mock_db.execute = AsyncMock(return_value=FakeResult(None))
     
-    service = WorkoutSyncService(mock_db)
     exists = await service.activity_exists("nonexistent")
     
     assert exists is False
 
 @pytest.mark.asyncio
-async def test_parse_activity_data():
+async def test_parse_activity_data(sync_service):
     """Test parsing of Garmin activity data"""
-    mock_db = AsyncMock()
-    service = WorkoutSyncService(mock_db)
+    service, _, _ = sync_service
     
     activity_data = {
         'activityId': '987654321',
@@ -223,13 +187,15 @@ async def test_parse_activity_data():
         'avgPower': 230,
         'maxPower': 450,
         'averageBikingCadenceInRevPerMinute': 85,
-        'elevationGain': 800
+        'elevationGain': 800,
+        'temperature': 21
     }
     
     result = await service.parse_activity_data(activity_data)
     
     assert result['garmin_activity_id'] == '987654321'
     assert result['activity_type'] == 'cycling'
+    assert result['start_time'] == datetime(2024, 1, 15, 8, 30, tzinfo=timezone.utc)
     assert result['duration_seconds'] == 7200
     assert result['distance_m'] == 50000
     assert result['avg_hr'] == 145
@@ -238,23 +204,15 @@ async def test_parse_activity_data():
     assert result['max_power'] == 450
     assert result['avg_cadence'] == 85
     assert result['elevation_gain_m'] == 800
-    assert result['metrics'] == activity_data  # Full data stored as JSONB
+    assert result['metrics'] == {'temperature': 21}  # Only unmapped fields stored as JSONB
 
 @pytest.mark.asyncio
-async def test_sync_with_network_timeout():
+async def test_sync_with_network_timeout(sync_service):
     """Test handling of network timeouts during sync"""
-    mock_db = AsyncMock()
-    mock_db.add = MagicMock()
-    mock_db.commit = AsyncMock()
-    mock_db.refresh = AsyncMock()
-    
-    service = WorkoutSyncService(mock_db)
+    service, mock_db, mock_garmin = sync_service
     
     # Simulate timeout error
-    import asyncio
-    service.garmin_service.get_activities = AsyncMock(
-        side_effect=asyncio.TimeoutError("Request timed out")
-    )
+    mock_garmin.get_activities.side_effect = asyncio.TimeoutError("Request timed out")
     
     with pytest.raises(Exception):  # Should raise the timeout error
         await service.sync_recent_activities()
@@ -263,4 +221,21 @@ async def test_sync_with_network_timeout():
     sync_log_calls = [call for call in mock_db.add.call_args_list 
                      if isinstance(call[0][0], GarminSyncLog)]
     sync_log = sync_log_calls[0][0][0]
-    assert sync_log.status == "error"
\ No newline at end of file
+    assert sync_log.status == GarminSyncStatus.FAILED
+
+
+@pytest.mark.asyncio
+async def test_retry_async_backoff_schedule(no_sleep):
+    """Test that retry_async backs off exponentially and re-raises after the last attempt"""
+    calls = []
+
+    @retry_async((GarminAPIError,), attempts=3, initial_delay=1, jitter=0)
+    async def flaky():
+        calls.append(1)
+        raise GarminAPIError("still failing")
+
+    with pytest.raises(GarminAPIError):
+        await flaky()
+
+    assert len(calls) == 3
+    assert [c.args[0] for c in no_sleep.await_args_list] == [1, 2]
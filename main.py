@@ -5,12 +5,13 @@ Entry point for the terminal-based cycling training coach.
 """
 import argparse
 import asyncio
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import queue
 from pathlib import Path
 import sys
-from typing import Optional
-from datetime import datetime
+from typing import Optional, Set
 import os
 
 from textual.app import App, ComposeResult
@@ -23,7 +24,7 @@ from textual.logging import TextualHandler
 from textual import on
 
 from backend.app.config import settings
-from backend.app.database import init_db
+from backend.app.database import DATA_DIR, init_db
 # Use working dashboard with static content
 from tui.views.dashboard_working import WorkingDashboardView as DashboardView
 from tui.views.workouts import WorkoutView
@@ -31,6 +32,7 @@ from tui.views.plans import PlanView
 from tui.views.rules import RuleView
 from tui.views.routes import RouteView
 from backend.app.database import AsyncSessionLocal
+from backend.app.services.ai_service import aclose_http_client
 from tui.services.workout_service import WorkoutService
 
 
@@ -78,21 +80,41 @@ class CyclingCoachApp(App):
     
     TITLE = "AI Cycling Coach"
     SUB_TITLE = "Terminal Training Interface"
+
+    # Views mounted into their (initially empty) tab pane on first activation
+    LAZY_VIEWS = {
+        "workouts-tab": (WorkoutView, "workout-view"),
+        "plans-tab": (PlanView, "plan-view"),
+        "rules-tab": (RuleView, "rule-view"),
+        "routes-tab": (RouteView, "route-view"),
+    }
+
+    # Background writer for logs/app.log, shared by every app instance and
+    # started by the first _setup_logging() call
+    _log_listener: Optional[QueueListener] = None
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.current_view = "dashboard"
+        self._mounted_tabs: Set[str] = set()
+        self._active_nav_button: Optional[Button] = None
         self._setup_logging()
     
     def _setup_logging(self, level=logging.INFO):
-        """Configure logging for the TUI application."""
-        # Create logs directory
-        logs_dir = Path("logs")
-        logs_dir.mkdir(exist_ok=True)
-        
+        """Configure logging for the TUI application.
+
+        Safe to call again: later calls only change the level, so there is
+        never more than one handler set or log file writer.
+        """
         # Set up logger
         logger = logging.getLogger("cycling_coach")
         logger.setLevel(level)
+        if self._log_listener is not None:
+            return
+
+        # Create logs directory
+        logs_dir = Path("logs")
+        logs_dir.mkdir(exist_ok=True)
         
         # Add Textual handler for TUI-compatible logging
         textual_handler = TextualHandler()
@@ -106,7 +128,16 @@ class CyclingCoachApp(App):
         file_handler.setFormatter(
             logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
         )
-        logger.addHandler(file_handler)
+        # Write (and rotate) the log file on a background thread so logging
+        # never blocks the event loop on disk I/O
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(QueueHandler(log_queue))
+        # The logger is process-wide, so the listener is kept on the class
+        listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        CyclingCoachApp._log_listener = listener
+        listener.start()
+        # Flush queued records before the process exits
+        atexit.register(listener.stop)
     
     def compose(self) -> ComposeResult:
         """Create the main application layout."""
@@ -131,24 +162,19 @@ class CyclingCoachApp(App):
                         with TabPane("Dashboard", id="dashboard-tab"):
                             yield DashboardView(id="dashboard-view")
                         
-                        with TabPane("Workouts", id="workouts-tab"):
-                            yield WorkoutView(id="workout-view")
-                        
-                        with TabPane("Plans", id="plans-tab"):
-                            yield PlanView(id="plan-view")
-                        
-                        with TabPane("Rules", id="rules-tab"):
-                            yield RuleView(id="rule-view")
-                        
-                        with TabPane("Routes", id="routes-tab"):
-                            yield RouteView(id="route-view")
+                        # Filled in by on_tab_activated when first shown
+                        yield TabPane("Workouts", id="workouts-tab")
+                        yield TabPane("Plans", id="plans-tab")
+                        yield TabPane("Rules", id="rules-tab")
+                        yield TabPane("Routes", id="routes-tab")
         
         yield Footer()
 
     async def on_mount(self) -> None:
         """Initialize the application when mounted."""
         # Set initial active navigation and tab
-        self.query_one("#nav-dashboard").add_class("-active")
+        self._active_nav_button = self.query_one("#nav-dashboard", Button)
+        self._active_nav_button.add_class("-active")
         tabs = self.query_one("#main-tabs", TabbedContent)
         if tabs:
             tabs.active = "dashboard-tab"
@@ -175,21 +201,34 @@ class CyclingCoachApp(App):
             tabs = self.query_one("#main-tabs")
             tabs.active = nav_mapping[button_id]
             
-            # Update navigation button styles
-            for nav_button in self.query("Button"):
-                nav_button.remove_class("-active")
+            # Move the highlight from the previously active nav button
+            if self._active_nav_button is not None:
+                self._active_nav_button.remove_class("-active")
             event.button.add_class("-active")
+            self._active_nav_button = event.button
 
     @on(TabbedContent.TabActivated)
     async def on_tab_activated(self, event: TabbedContent.TabActivated) -> None:
         """Handle tab activation to load data for the active tab."""
-        if event.pane.id == "workouts-tab":
+        pane_id = event.pane.id
+        if pane_id in self.LAZY_VIEWS and pane_id not in self._mounted_tabs:
+            self._mounted_tabs.add(pane_id)
+            view_class, view_id = self.LAZY_VIEWS[pane_id]
+            # Views load their own data when mounted
+            await event.pane.mount(view_class(id=view_id))
+            return
+
+        if pane_id == "workouts-tab":
             workout_view = self.query_one("#workout-view", WorkoutView)
             workout_view.load_data()
 
     def action_quit(self) -> None:
         self.exit()
 
+    async def on_unmount(self) -> None:
+        # Close the pooled OpenRouter client before this app's event loop ends
+        await aclose_http_client()
+
 async def init_db_async():
     logger = logging.getLogger("cycling_coach")
     try:
@@ -215,6 +254,25 @@ async def sync_garmin_activities_cli():
         logger.error(f"Error during Garmin activity sync: {e}")
         sys.exit(1)
 
+# Columns of the --list-workouts table: date, type, duration, distance, avg HR, avg power
+ROW_FMT = "{:<12} {:<15} {:<10} {:<10} {:<8} {:<10}"
+
+def format_workout_row(workout: dict) -> tuple:
+    """Format a raw workout dict into the cells of one ROW_FMT table row."""
+    start_time = workout["start_time"]
+    duration = workout["duration_seconds"]
+    distance = workout["distance_m"]
+    avg_hr = workout["avg_hr"]
+    avg_power = workout["avg_power"]
+    return (
+        start_time.strftime("%m/%d %H:%M") if start_time else "Unknown",
+        (workout["activity_type"] or "Unknown")[:14],
+        f"{duration // 60}min" if duration else "N/A",
+        f"{distance / 1000:.1f}km" if distance else "N/A",
+        f"{avg_hr} BPM" if avg_hr else "N/A",
+        f"{avg_power} W" if avg_power else "N/A",
+    )
+
 async def list_workouts_cli():
     """Display workouts in CLI format without starting TUI."""
     logger = logging.getLogger("cycling_coach")
@@ -223,63 +281,46 @@ async def list_workouts_cli():
         logger.info("Initializing database for listing workouts...")
         await init_db_async()
 
-        # Get workouts using WorkoutService
+        lines = [
+            "AI Cycling Coach - Workouts",
+            "=" * 80,
+            ROW_FMT.format("Date", "Type", "Duration", "Distance", "Avg HR", "Avg Power"),
+            "-" * 80,
+        ]
+        header_size = len(lines)
+
+        # Format rows as they stream in rather than collecting the workouts first
         async with AsyncSessionLocal() as db:
             workout_service = WorkoutService(db)
-            workouts = await workout_service.get_workouts(limit=50)
+            async for workout in workout_service.iter_workouts(limit=50, raw=True):
+                lines.append(ROW_FMT.format(*format_workout_row(workout)))
 
-        if not workouts:
+        total = len(lines) - header_size
+        if not total:
             logger.info("No workouts found.")
             return
 
-        # Print header
-        logger.info("AI Cycling Coach - Workouts")
-        logger.info("=" * 80)
-        logger.info(f"{'Date':<12} {'Type':<15} {'Duration':<10} {'Distance':<10} {'Avg HR':<8} {'Avg Power':<10}")
-        logger.info("-" * 80)
-
-        # Print each workout
-        for workout in workouts:
-            # Format date
-            date_str = "Unknown"
-            if workout.get("start_time"):
-                try:
-                    dt = datetime.fromisoformat(workout["start_time"].replace('Z', '+00:00'))
-                    date_str = dt.strftime("%m/%d %H:%M")
-                except:
-                    date_str = workout["start_time"][:10]
-
-            # Format duration
-            duration_str = "N/A"
-            if workout.get("duration_seconds"):
-                minutes = workout["duration_seconds"] // 60
-                duration_str = f"{minutes}min"
-
-            # Format distance
-            distance_str = "N/A"
-            if workout.get("distance_m"):
-                distance_str = f"{workout['distance_m'] / 1000:.1f}km"
-
-            # Format heart rate
-            hr_str = "N/A"
-            if workout.get("avg_hr"):
-                hr_str = f"{workout['avg_hr']} BPM"
-
-            # Format power
-            power_str = "N/A"
-            if workout.get("avg_power"):
-                power_str = f"{workout['avg_power']} W"
-
-            logger.info(f"{date_str:<12} {workout.get('activity_type', 'Unknown')[:14]:<15} {duration_str:<10} {distance_str:<10} {hr_str:<8} {power_str:<10}")
-
-        logger.info(f"\nTotal workouts: {len(workouts)}")
+        # Write the whole table to stdout in one call
+        lines.append(f"\nTotal workouts: {total}\n")
+        sys.stdout.write("\n".join(lines))
 
     except Exception as e:
         logger.error(f"Error listing workouts: {e}")
         sys.exit(1)
 
+def install_uvloop() -> None:
+    """Use uvloop's event loop for every asyncio.run() when it is available."""
+    try:
+        import uvloop
+    except ImportError:
+        # Not installed, or unsupported platform (Windows); keep the default loop
+        return
+    uvloop.install()
+
 def main():
     """Main entry point for the CLI application."""
+    install_uvloop()
+
     parser = argparse.ArgumentParser(description="AI Cycling Coach - Terminal Training Interface")
     parser.add_argument("--list-workouts", action="store_true",
                        help="List all workouts in CLI format and exit")
@@ -309,17 +350,15 @@ def main():
         return
         return
 
-    # Create data directory if it doesn't exist
-    data_dir = Path("data")
-    data_dir.mkdir(exist_ok=True)
-    (data_dir / "gpx").mkdir(exist_ok=True)
-    (data_dir / "sessions").mkdir(exist_ok=True)
+    # Create the data directories; parents=True also creates DATA_DIR itself
+    for data_subdir in (DATA_DIR / "gpx", DATA_DIR / "sessions"):
+        data_subdir.mkdir(parents=True, exist_ok=True)
 
     # Initialize database BEFORE starting the app
     asyncio.run(init_db_async())
 
     # Run the TUI application
-    # Run the TUI application
+    app = CyclingCoachApp()
     app.run()
 
 
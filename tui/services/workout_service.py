@@ -1,7 +1,8 @@
 """
 Enhanced workout service with debugging for TUI application.
 """
-from typing import Dict, List, Optional
+from operator import attrgetter
+from typing import Any, AsyncIterator, Dict, List, Optional
 import logging
 from sqlalchemy import select, desc, text
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -14,6 +15,48 @@ from backend.app.services.ai_service import AIService
 
 logger = logging.getLogger(__name__)
 
+# Workout columns shown in lists; get_workout adds metrics on top
+_WORKOUT_FIELDS = (
+    "id",
+    "garmin_activity_id",
+    "activity_type",
+    "start_time",
+    "duration_seconds",
+    "distance_m",
+    "avg_hr",
+    "max_hr",
+    "avg_power",
+    "max_power",
+    "avg_cadence",
+    "elevation_gain_m",
+)
+_WORKOUT_COLUMNS = tuple(getattr(Workout, field) for field in _WORKOUT_FIELDS)
+_get_workout_fields = attrgetter(*_WORKOUT_FIELDS)
+
+
+def _workout_to_dict(workout: Any, raw: bool = False) -> Dict:
+    """Convert a Workout, or a row selected from _WORKOUT_COLUMNS, to a dict.
+
+    start_time is ISO formatted unless ``raw`` is set, which keeps the datetime.
+    """
+    workout_dict = dict(zip(_WORKOUT_FIELDS, _get_workout_fields(workout)))
+    if raw:
+        return workout_dict
+    start_time = workout_dict["start_time"]
+    workout_dict["start_time"] = start_time.isoformat() if start_time else None
+    return workout_dict
+
+
+def _analysis_to_dict(analysis: Analysis) -> Dict:
+    return {
+        "id": analysis.id,
+        "analysis_type": analysis.analysis_type,
+        "feedback": analysis.jsonb_feedback,
+        "suggestions": analysis.suggestions,
+        "created_at": analysis.created_at.isoformat(),
+        "approved": analysis.approved,
+    }
+
 
 class WorkoutService:
     """Service for workout operations."""
@@ -24,67 +67,36 @@ class WorkoutService:
     async def get_workouts(self, limit: Optional[int] = None) -> List[Dict]:
         """Get all workouts with enhanced debugging."""
         try:
-            print(f"WorkoutService.get_workouts: Starting query with limit={limit}")
-            
-            # First, let's check if the table exists and has data
-            count_result = await self.db.execute(text("SELECT COUNT(*) FROM workouts"))
-            total_count = count_result.scalar()
-            print(f"WorkoutService.get_workouts: Total workouts in database: {total_count}")
-            
-            if total_count == 0:
-                print("WorkoutService.get_workouts: No workouts found in database")
-                return []
+            logger.debug("get_workouts: starting query with limit=%s", limit)
             
-            # Build the query
-            query = select(Workout).order_by(desc(Workout.start_time))
+            # Select only the listed columns; skips the metrics JSON and ORM instance setup
+            query = select(*_WORKOUT_COLUMNS).order_by(desc(Workout.start_time))
             if limit:
                 query = query.limit(limit)
-                
-            print(f"WorkoutService.get_workouts: Executing query: {query}")
             
-            # Execute the query
             result = await self.db.execute(query)
-            print("WorkoutService.get_workouts: Query executed successfully")
-            
-            # Get all workouts
-            workouts = result.scalars().all()
-            print(f"WorkoutService.get_workouts: Retrieved {len(workouts)} workout objects")
+            workout_dicts = [_workout_to_dict(row) for row in result]
             
-            # Convert to dictionaries
-            workout_dicts = []
-            for i, w in enumerate(workouts):
-                print(f"WorkoutService.get_workouts: Processing workout {i+1}: ID={w.id}, Type={w.activity_type}")
-                workout_dict = {
-                    "id": w.id,
-                    "garmin_activity_id": w.garmin_activity_id,
-                    "activity_type": w.activity_type,
-                    "start_time": w.start_time.isoformat() if w.start_time else None,
-                    "duration_seconds": w.duration_seconds,
-                    "distance_m": w.distance_m,
-                    "avg_hr": w.avg_hr,
-                    "max_hr": w.max_hr,
-                    "avg_power": w.avg_power,
-                    "max_power": w.max_power,
-                    "avg_cadence": w.avg_cadence,
-                    "elevation_gain_m": w.elevation_gain_m
-                }
-                workout_dicts.append(workout_dict)
-            
-            print(f"WorkoutService.get_workouts: Returning {len(workout_dicts)} workouts")
+            logger.debug("get_workouts: returning %s workouts", len(workout_dicts))
             return workout_dicts
             
-        except Exception as e:
-            # Enhanced error logging
-            import traceback
-            print(f"WorkoutService.get_workouts: ERROR: {str(e)}")
-            print(f"WorkoutService.get_workouts: Traceback: {traceback.format_exc()}")
-            
-            # Log error properly
-            import logging
-            logging.error(f"Error fetching workouts: {str(e)}")
-            logging.error(f"Traceback: {traceback.format_exc()}")
+        except Exception:
+            # The traceback is only formatted if a handler emits the record
+            logger.exception("Error fetching workouts")
             return []
     
+    async def iter_workouts(self, limit: Optional[int] = None, raw: bool = False) -> AsyncIterator[Dict]:
+        """Yield workouts newest first as rows arrive, in the same form as get_workouts.
+
+        With ``raw``, start_time is yielded as a datetime instead of an ISO string.
+        """
+        query = select(*_WORKOUT_COLUMNS).order_by(desc(Workout.start_time))
+        if limit:
+            query = query.limit(limit)
+        result = await self.db.stream(query)
+        async for row in result:
+            yield _workout_to_dict(row, raw)
+
     async def debug_database_connection(self) -> Dict:
         """Debug method to check database connection and table status."""
         debug_info = {}
@@ -133,21 +145,9 @@ class WorkoutService:
             if not workout:
                 return None
                 
-            return {
-                "id": workout.id,
-                "garmin_activity_id": workout.garmin_activity_id,
-                "activity_type": workout.activity_type,
-                "start_time": workout.start_time.isoformat() if workout.start_time else None,
-                "duration_seconds": workout.duration_seconds,
-                "distance_m": workout.distance_m,
-                "avg_hr": workout.avg_hr,
-                "max_hr": workout.max_hr,
-                "avg_power": workout.avg_power,
-                "max_power": workout.max_power,
-                "avg_cadence": workout.avg_cadence,
-                "elevation_gain_m": workout.elevation_gain_m,
-                "metrics": workout.metrics
-            }
+            workout_dict = _workout_to_dict(workout)
+            workout_dict["metrics"] = workout.metrics
+            return workout_dict
             
         except Exception as e:
             raise Exception(f"Error fetching workout {workout_id}: {str(e)}")
@@ -170,18 +170,19 @@ class WorkoutService:
         result = await self.db.execute(
             select(Analysis).where(Analysis.workout_id == workout_id).order_by(desc(Analysis.created_at))
         )
-        analyses = result.scalars().all()
-        return [
-            {
-                "id": a.id,
-                "analysis_type": a.analysis_type,
-                "feedback": a.feedback,
-                "suggestions": a.suggestions,
-                "created_at": a.created_at.isoformat(),
-                "approved": a.approved,
-            }
-            for a in analyses
-        ]
+        return [_analysis_to_dict(a) for a in result.scalars()]
+
+    async def get_analyses_for_workouts(self, workout_ids: List[int]) -> Dict[int, List[Dict]]:
+        """Get the analyses of several workouts in one query, keyed by workout ID."""
+        analyses_by_workout: Dict[int, List[Dict]] = {workout_id: [] for workout_id in workout_ids}
+        if not workout_ids:
+            return analyses_by_workout
+        result = await self.db.execute(
+            select(Analysis).where(Analysis.workout_id.in_(workout_ids)).order_by(desc(Analysis.created_at))
+        )
+        for a in result.scalars():
+            analyses_by_workout[a.workout_id].append(_analysis_to_dict(a))
+        return analyses_by_workout
 
     async def sync_garmin_activities(self, days_back: int = 7) -> Dict:
         """Sync Garmin activities."""
@@ -0,0 +1,43 @@
+"""Lightweight stand-ins for Textual widgets used by the WorkoutView tests."""
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, MagicMock, patch
+
+
+class FakeDataTable:
+    """Stands in for DataTable with only the methods the view calls."""
+
+    def __init__(self, id=None):
+        self.id = id
+        self.clear = MagicMock()
+        self.add_row = MagicMock()
+
+
+class FakeStatic:
+    """Stands in for Static with only the methods the view calls."""
+
+    def __init__(self):
+        self.update = MagicMock()
+
+
+class FakeTabs:
+    """Stands in for TabbedContent; the view only sets ``active``."""
+
+    active = None
+
+
+@contextmanager
+def stub_ui(view):
+    """Replace the view's UI update methods with mocks for the duration.
+
+    Yields a namespace of the mocks, so tests can assert on e.g. ui.refresh.
+    """
+    with patch.multiple(
+        view,
+        refresh=DEFAULT,
+        populate_workouts_table=DEFAULT,
+        update_sync_status=DEFAULT,
+        post_message=DEFAULT,
+        query_one=DEFAULT,
+    ) as mocks:
+        yield SimpleNamespace(**mocks)
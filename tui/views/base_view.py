@@ -1,50 +1,113 @@
-from textual.app import ComposeResult
+from __future__ import annotations
+
 from textual.widget import Widget
-from textual.worker import Worker, get_current_worker
-from textual import work, on
-import sys
-from typing import Callable, Any, Coroutine, Optional
+from textual.message import Message
+from textual.worker import WorkerState
+import asyncio
+import time
+from typing import TYPE_CHECKING, Callable, Any, Coroutine, Dict, Hashable, Optional
 from tui.widgets.error_modal import ErrorModal
 
+if TYPE_CHECKING:
+    from textual.worker import Worker
+
 class BaseView(Widget):
     """Base view class with async utilities that all views should inherit from."""
-    
-    def run_async(self, coro: Coroutine, callback: Callable[[Any], None] = None) -> Worker:
-        """Run an async task in the background with proper error handling."""
-        sys.stdout.write("BaseView.run_async: START\n")
+
+    # Minimum seconds between error bells, shared by every view so a burst of
+    # failures across the app rings once.
+    BELL_INTERVAL = 2.0
+    _last_bell = 0.0
+
+    class AsyncOpResult(Message, bubble=False):
+        """Message posted by a worker when an async operation finishes or fails."""
+        def __init__(self, ok: bool, payload: Any, callback: Optional[Callable] = None):
+            super().__init__()
+            self.ok = ok
+            # The result on success, the error text on failure
+            self.payload = payload
+            # The run_async callback on success, the retry action on failure
+            self.callback = callback
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Running workers started with a run_async key, for deduplication.
+        self._inflight: Dict[Hashable, Worker] = {}
+
+    def run_async(self, coro_fn: Callable[[], Coroutine], callback: Callable[[Any], None] = None,
+                  key: Optional[Hashable] = None) -> Worker:
+        """Run an async task in the background with proper error handling.
+
+        ``coro_fn`` is called to create the coroutine, and called again for
+        each retry, since a coroutine object can only be awaited once.
+
+        When ``key`` is given and a worker for the same key is still running,
+        that worker is returned instead of starting (and cancelling) a new one.
+        """
+        if key is not None:
+            inflight = self._inflight.get(key)
+            if inflight is not None and not inflight.is_finished:
+                return inflight
         worker = self.run_worker(
-            self._async_wrapper(coro, callback),
+            self._async_wrapper(coro_fn, callback, key),
             exclusive=True,
             group="db_operations"
         )
-        sys.stdout.write("BaseView.run_async: END\n")
+        if key is not None:
+            self._inflight[key] = worker
         return worker
-    
-    async def _async_wrapper(self, coro: Coroutine, callback: Callable[[Any], None] = None) -> None:
-        """Wrapper for async operations with cancellation support."""
-        sys.stdout.write("BaseView._async_wrapper: START\n")
-        try:
-            sys.stdout.write("BaseView._async_wrapper: Before await coro\n")
-            result = await coro
-            sys.stdout.write("BaseView._async_wrapper: After await coro\n")
-            if callback:
-                sys.stdout.write("BaseView._async_wrapper: Calling callback\n")
-                self.call_after_refresh(callback, result)
-        except Exception as e:
-            sys.stdout.write(f"BaseView._async_wrapper: ERROR: {str(e)}\n")
-            self.log(f"Async operation failed: {str(e)}", severity="error")
-            self.app.bell()
-            self.call_after_refresh(
-                self.show_error,
-                str(e),
-                lambda: self.run_async(coro, callback)
-            )
-        finally:
-            sys.stdout.write("BaseView._async_wrapper: FINALLY\n")
-            worker = get_current_worker()
-            if worker and worker.is_cancelled:
-                sys.stdout.write("BaseView._async_wrapper: Worker cancelled\n")
-                self.log("Async operation cancelled")
+
+    async def _async_wrapper(self, coro_fn: Callable[[], Coroutine], callback: Callable[[Any], None] = None,
+                             key: Optional[Hashable] = None) -> None:
+        """Wrapper for async operations with retry support.
+
+        On failure the error modal is shown and the worker waits for its Retry
+        button; a dismissed error leaves it waiting until the next run_async
+        call replaces it in the exclusive worker group. While waiting, the
+        worker is not registered under ``key``, so a reload is not deduplicated
+        against it.
+        """
+        while True:
+            try:
+                result = await coro_fn()
+            except Exception as e:
+                self.log(f"Async operation failed: {str(e)}", severity="error")
+                now = time.monotonic()
+                if now - self._last_bell > self.BELL_INTERVAL:
+                    self.app.bell()
+                    BaseView._last_bell = now
+                retry_requested = asyncio.Event()
+                self.post_message(self.AsyncOpResult(False, str(e), retry_requested.set))
+                worker = self._inflight.pop(key, None)
+                await retry_requested.wait()
+                if worker is not None:
+                    self._inflight[key] = worker
+                continue
+            self.post_message(self.AsyncOpResult(True, result, callback))
+            return
+
+    def on_base_view_async_op_result(self, message: AsyncOpResult) -> None:
+        """Deliver a worker's result to its callback, or show its error."""
+        if message.ok:
+            if message.callback:
+                message.callback(message.payload)
+        else:
+            self.show_error(message.payload, message.callback)
+
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        """Log cancelled DB operations and drop finished keyed workers.
+
+        Textual posts this on every state change.
+        """
+        if event.worker.group != "db_operations":
+            return
+        if event.state == WorkerState.CANCELLED:
+            self.log("Async operation cancelled")
+        if event.worker.is_finished:
+            inflight = self._inflight
+            for key, worker in list(inflight.items()):
+                if worker is event.worker:
+                    del inflight[key]
 
     def show_error(self, message: str, retry_action: Optional[Callable] = None) -> None:
         """Display error modal with retry option."""
@@ -0,0 +1,194 @@
+"""
+Shared fixtures for the WorkoutView tests.
+"""
+import asyncio
+import pytest
+import pytest_asyncio
+from types import MappingProxyType
+from unittest.mock import AsyncMock, patch
+from textual.app import App
+
+from tui.views.workouts import WorkoutView
+from tui.services.workout_service import WorkoutService
+
+
+# Mock data, built once at import from read-only mappings so that tests
+# sharing it cannot mutate it. Copy with dict() where a test needs to.
+_MOCK_WORKOUTS = tuple(MappingProxyType(workout) for workout in [
+    {
+        "id": 1,
+        "garmin_activity_id": "123456789",
+        "activity_type": "cycling",
+        "start_time": "2024-01-15T14:30:00Z",
+        "duration_seconds": 4500,
+        "distance_m": 32500,
+        "avg_hr": 145,
+        "max_hr": 165,
+        "avg_power": 180,
+        "max_power": 320,
+        "avg_cadence": 85,
+        "elevation_gain_m": 450
+    },
+    {
+        "id": 2,
+        "garmin_activity_id": "987654321",
+        "activity_type": "running",
+        "start_time": "2024-01-14T09:15:00Z",
+        "duration_seconds": 2700,
+        "distance_m": 8000,
+        "avg_hr": 155,
+        "max_hr": 175,
+        "avg_power": None,
+        "max_power": None,
+        "avg_cadence": 180,
+        "elevation_gain_m": 120
+    }
+])
+
+_MOCK_SYNC_STATUS = MappingProxyType({
+    "status": "connected",
+    "last_sync_time": "2024-01-15T15:00:00Z",
+    "activities_synced": 25,
+    "error_message": None
+})
+
+_MOCK_WORKOUT_ANALYSES = tuple(MappingProxyType(analysis) for analysis in [
+    {
+        "id": 1,
+        "workout_id": 1,
+        "analysis_type": "performance",
+        "feedback": {
+            "effort_level": "moderate",
+            "pacing": "consistent",
+            "heart_rate_zones": "well distributed"
+        },
+        "suggestions": {
+            "recovery": "Take an easy day tomorrow",
+            "training": "Focus on interval training next week"
+        },
+        "approved": False,
+        "created_at": "2024-01-15T16:00:00Z"
+    }
+])
+
+
+@pytest.fixture(scope="session")
+def mock_workouts():
+    """Sample workout data for testing."""
+    return _MOCK_WORKOUTS
+
+
+@pytest.fixture(scope="session")
+def mock_sync_status():
+    """Sample sync status data for testing."""
+    return _MOCK_SYNC_STATUS
+
+
+@pytest.fixture(scope="session")
+def mock_workout_analyses():
+    """Sample workout analysis data for testing."""
+    return _MOCK_WORKOUT_ANALYSES
+
+
+@pytest.fixture(scope="session")
+def mock_workout_service():
+    """Mock WorkoutService with all required methods.
+
+    Specs are built once per session; _reset_service restores it between
+    tests. A copy.copy() per test would not isolate anything, because a
+    shallow copy shares the template's child mocks.
+    """
+    service = AsyncMock(spec=WorkoutService)
+    service.get_workouts = AsyncMock()
+    service.get_sync_status = AsyncMock()
+    service.get_workout_analyses = AsyncMock()
+    service.sync_garmin_activities = AsyncMock()
+    service.analyze_workout = AsyncMock()
+    service.approve_analysis = AsyncMock()
+    return service
+
+
+@pytest.fixture
+def patched_service(mock_workout_service):
+    """Patch the view's database session and WorkoutService for one test.
+
+    Yields the shared service mock, ready for return values to be set.
+    """
+    with patch('tui.views.workouts.AsyncSessionLocal') as mock_session_local, \
+         patch('tui.views.workouts.WorkoutService', return_value=mock_workout_service):
+        mock_session_local.return_value.__aenter__.return_value = AsyncMock()
+        yield mock_workout_service
+
+
+@pytest_asyncio.fixture
+async def pilot():
+    """Pilot for an App running for one test.
+
+    run_test() sets context variables on entry and resets them on exit, and
+    pytest-asyncio runs fixture setup and teardown in different contexts, so
+    the app is run inside a task of its own for the lifetime of the fixture.
+    """
+    started = asyncio.Event()
+    finished = asyncio.Event()
+    pilots = []
+
+    async def run_app():
+        async with App().run_test() as app_pilot:
+            pilots.append(app_pilot)
+            started.set()
+            await finished.wait()
+
+    app_task = asyncio.create_task(run_app())
+    await started.wait()
+    yield pilots[0]
+    finished.set()
+    await app_task
+
+
+@pytest.fixture
+def mount(pilot):
+    """Async function that mounts a widget into the test's app and returns it.
+
+    The mount runs from the app's own message loop via call_later, so the
+    widget's tasks see the app as the active one.
+    """
+    async def mount_widget(widget):
+        mounted = asyncio.Event()
+
+        async def do_mount():
+            await pilot.app.mount(widget)
+            mounted.set()
+
+        pilot.app.call_later(do_mount)
+        await mounted.wait()
+        return widget
+
+    return mount_widget
+
+
+@pytest.fixture
+def view():
+    """A WorkoutView that is never mounted, for tests that only call its methods.
+
+    Anything that reaches self.app, such as the error-path logging, needs the
+    mounted workout_view fixture instead.
+    """
+    return WorkoutView()
+
+
+@pytest_asyncio.fixture
+async def workout_view(mount):
+    """A WorkoutView mounted into the test's app.
+
+    The automatic load on mount is patched out so no test touches the real
+    database or leaves an error modal behind.
+    """
+    with patch.object(WorkoutView, 'load_data'):
+        return await mount(WorkoutView())
+
+
+@pytest.fixture(autouse=True)
+def _reset_service(mock_workout_service):
+    """Clear calls and return values on the shared service mock after each test."""
+    yield
+    mock_workout_service.reset_mock(return_value=True, side_effect=True)
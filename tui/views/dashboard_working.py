@@ -2,11 +2,37 @@
 Working Dashboard view for AI Cycling Coach TUI.
 Simple version that displays content without complex async loading.
 """
+from textual import events
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, Vertical, ScrollableContainer
 from textual.widgets import Static, DataTable
 from textual.widget import Widget
 
+# Columns and sample rows for the recent workouts table
+_RECENT_WORKOUT_COLUMNS = ("Date", "Type", "Duration", "Distance", "Avg HR")
+_RECENT_WORKOUT_ROWS = (
+    ("12/08 14:30", "Cycling", "75min", "32.5km", "145bpm"),
+    ("12/06 09:15", "Cycling", "90min", "45.2km", "138bpm"),
+    ("12/04 16:45", "Cycling", "60min", "25.8km", "152bpm"),
+    ("12/02 10:00", "Cycling", "120min", "68.1km", "141bpm"),
+)
+
+# Lines shown in each stats panel
+_WEEK_STATS = ("Workouts: 4", "Distance: 171.6 km", "Time: 5h 45m")
+_PLAN_STATS = ("Base Building v1 (Created: 12/01)", "Week 2 of 4 - On Track")
+_SYNC_STATS = ("Status: Connected ✅", "Last: 12/08 15:30 (4 activities)")
+_SYSTEM_STATS = ("Database: ✅ Connected", "Tables: ✅ All created", "Views: ✅ Working correctly!")
+
+
+def _stats_panel(title: str, lines) -> ComposeResult:
+    """Yield a bordered stats panel with all lines in a single Static.
+
+    The lines are plain text, so markup parsing is skipped for them.
+    """
+    with Container(classes="stats-container"):
+        yield Static(title, classes="section-title")
+        yield Static("\n".join(lines), classes="stat-item", markup=False)
+
 
 class WorkingDashboardView(Widget):
     """Simple working dashboard view."""
@@ -40,6 +66,8 @@ class WorkingDashboardView(Widget):
         margin: 0 1;
     }
     """
+
+    _populated = False
     
     def compose(self) -> ComposeResult:
         """Create dashboard layout with static content."""
@@ -50,41 +78,26 @@ class WorkingDashboardView(Widget):
                 # Left column - Recent workouts
                 with Vertical(classes="dashboard-column"):
                     yield Static("Recent Workouts", classes="section-title")
-                    workout_table = DataTable(id="recent-workouts")
-                    workout_table.add_columns("Date", "Type", "Duration", "Distance", "Avg HR")
-                    
-                    # Add sample data
-                    workout_table.add_row("12/08 14:30", "Cycling", "75min", "32.5km", "145bpm")
-                    workout_table.add_row("12/06 09:15", "Cycling", "90min", "45.2km", "138bpm") 
-                    workout_table.add_row("12/04 16:45", "Cycling", "60min", "25.8km", "152bpm")
-                    workout_table.add_row("12/02 10:00", "Cycling", "120min", "68.1km", "141bpm")
-                    
-                    yield workout_table
+                    # Filled in on first show, see _populate_dashboard
+                    yield DataTable(id="recent-workouts")
                 
                 # Right column - Quick stats and current plan
                 with Vertical(classes="dashboard-column"):
-                    # Weekly stats
-                    with Container(classes="stats-container"):
-                        yield Static("This Week", classes="section-title")
-                        yield Static("Workouts: 4", classes="stat-item")
-                        yield Static("Distance: 171.6 km", classes="stat-item")
-                        yield Static("Time: 5h 45m", classes="stat-item")
-                    
-                    # Active plan
-                    with Container(classes="stats-container"):
-                        yield Static("Current Plan", classes="section-title")
-                        yield Static("Base Building v1 (Created: 12/01)", classes="stat-item")
-                        yield Static("Week 2 of 4 - On Track", classes="stat-item")
-                    
-                    # Sync status
-                    with Container(classes="stats-container"):
-                        yield Static("Garmin Sync", classes="section-title")
-                        yield Static("Status: Connected ✅", classes="stat-item")
-                        yield Static("Last: 12/08 15:30 (4 activities)", classes="stat-item")
-                        
-                    # Database status  
-                    with Container(classes="stats-container"):
-                        yield Static("System Status", classes="section-title")
-                        yield Static("Database: ✅ Connected", classes="stat-item")
-                        yield Static("Tables: ✅ All created", classes="stat-item")
-                        yield Static("Views: ✅ Working correctly!", classes="stat-item")
\ No newline at end of file
+                    yield from _stats_panel("This Week", _WEEK_STATS)
+                    yield from _stats_panel("Current Plan", _PLAN_STATS)
+                    yield from _stats_panel("Garmin Sync", _SYNC_STATS)
+                    yield from _stats_panel("System Status", _SYSTEM_STATS)
+
+
+    def on_show(self, event: events.Show) -> None:
+        """Populate the dashboard the first time it becomes visible."""
+        if not self._populated:
+            self._populated = True
+            self._populate_dashboard()
+
+    def _populate_dashboard(self) -> None:
+        """Fill the recent workouts table."""
+        workout_table = self.query_one("#recent-workouts", DataTable)
+        workout_table.add_columns(*_RECENT_WORKOUT_COLUMNS)
+        # Add sample data in one batch
+        workout_table.add_rows(_RECENT_WORKOUT_ROWS)
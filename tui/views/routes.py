@@ -14,7 +14,7 @@ from textual.widget import Widget
 from textual.reactive import reactive
 from textual.message import Message
 
-from backend.app.database import AsyncSessionLocal
+from backend.app.database import DATA_DIR, AsyncSessionLocal
 from tui.services.route_service import RouteService
 
 
@@ -143,7 +143,7 @@ class RouteFileUpload(Widget):
         
         # Directory tree for local file browsing
         yield Label("Or browse local files:")
-        yield DirectoryTree("./data/gpx", id="gpx-directory")
+        yield DirectoryTree(DATA_DIR / "gpx", id="gpx-directory")
 
 
 class RouteView(Widget):
@@ -2,48 +2,50 @@
 Stub views for Plans, Rules, and Routes.
 These can be expanded later following the same async loading pattern.
 """
-from textual.app import ComposeResult
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from textual.widgets import Static
 from tui.views.base_view import BaseView
 
+if TYPE_CHECKING:
+    from textual.app import ComposeResult
+
+
+class _StubView(BaseView):
+    """Placeholder view showing a fixed title and body."""
+
+    _TITLE = ""
+    _BODY = ""
 
-class PlanView(BaseView):
-    """Training plan management view."""
-    
     def compose(self) -> ComposeResult:
-        """Create plan view layout."""
-        yield Static("Training Plans")
-        yield Static("Coming soon - this will show your training plans")
-    
+        """Create stub view layout."""
+        yield Static(self._TITLE)
+        yield Static(self._BODY)
+
     def load_data_if_needed(self) -> None:
-        """Load plan data if needed."""
+        """Load view data if needed."""
         # Implement similar to WorkoutView when ready
         pass
 
 
-class RuleView(BaseView):
+class PlanView(_StubView):
+    """Training plan management view."""
+
+    _TITLE = "Training Plans"
+    _BODY = "Coming soon - this will show your training plans"
+
+
+class RuleView(_StubView):
     """Training rule management view."""
-    
-    def compose(self) -> ComposeResult:
-        """Create rule view layout."""
-        yield Static("Training Rules")
-        yield Static("Coming soon - this will show your training rules")
-    
-    def load_data_if_needed(self) -> None:
-        """Load rule data if needed."""
-        # Implement similar to WorkoutView when ready
-        pass
 
+    _TITLE = "Training Rules"
+    _BODY = "Coming soon - this will show your training rules"
 
-class RouteView(BaseView):
+
+class RouteView(_StubView):
     """Route management view."""
-    
-    def compose(self) -> ComposeResult:
-        """Create route view layout."""
-        yield Static("Routes")
-        yield Static("Coming soon - this will show your routes")
-    
-    def load_data_if_needed(self) -> None:
-        """Load route data if needed."""
-        # Implement similar to WorkoutView when ready
-        pass
\ No newline at end of file
+
+    _TITLE = "Routes"
+    _BODY = "Coming soon - this will show your routes"
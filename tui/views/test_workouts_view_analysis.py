@@ -0,0 +1,201 @@
+"""
+Tests for WorkoutView workout details and analysis, and the analysis widgets.
+"""
+import pytest
+from unittest.mock import patch
+from textual.widgets import Static, Button, Collapsible
+
+from tui.views._fakes import FakeTabs, stub_ui
+from tui.views.workouts import WorkoutMetricsChart, WorkoutAnalysisPanel
+
+
+@pytest.mark.asyncio
+class TestWorkoutViewAnalysis:
+    """Test suite for workout details and analysis."""
+
+    async def test_analyze_selected_workout_success(self, mock_workouts, mock_workout_analyses, workout_view, patched_service):
+        """Test successful workout analysis."""
+        workout_view.selected_workout = mock_workouts[0]
+        
+        patched_service.analyze_workout.return_value = {
+            "status": "success",
+            "message": "Analysis completed"
+        }
+        patched_service.get_workout_analyses.return_value = mock_workout_analyses
+        
+        # Mock refresh and message posting
+        with stub_ui(workout_view) as ui:
+            
+            await workout_view.analyze_selected_workout()
+            
+            # Verify service calls
+            patched_service.analyze_workout.assert_called_once_with(1)  # workout ID
+            patched_service.get_workout_analyses.assert_called_once_with(1)
+            
+            # Verify UI updates
+            assert workout_view.workout_analyses == mock_workout_analyses
+            ui.refresh.assert_called()
+            
+            # Verify message posting
+            assert ui.post_message.called
+            message = ui.post_message.call_args[0][0]
+            assert hasattr(message, 'workout_id')
+            assert message.workout_id == 1
+
+    async def test_analyze_selected_workout_no_selection(self, workout_view):
+        """Test workout analysis when no workout is selected."""
+        workout_view.selected_workout = None
+        
+        # Should not raise exception, just log warning
+        await workout_view.analyze_selected_workout()
+        
+        # No service calls should be made
+        # (This would be verified by not mocking any services)
+
+    async def test_approve_analysis_success(self, mock_workouts, workout_view, patched_service):
+        """Test successful analysis approval."""
+        workout_view.selected_workout = mock_workouts[0]
+        
+        patched_service.approve_analysis.return_value = {
+            "status": "success",
+            "message": "Analysis approved"
+        }
+        patched_service.get_workout_analyses.return_value = []
+        
+        # Mock refresh
+        with patch.object(workout_view, 'refresh') as mock_refresh:
+            
+            await workout_view.approve_analysis(1)
+            
+            # Verify service calls
+            patched_service.approve_analysis.assert_called_once_with(1)
+            patched_service.get_workout_analyses.assert_called_once_with(1)
+            
+            # Verify UI refresh
+            mock_refresh.assert_called_once()
+
+    async def test_show_workout_details(self, mock_workouts, mock_workout_analyses, view, patched_service):
+        """Test showing workout details view."""
+        patched_service.get_workout_analyses.return_value = mock_workout_analyses
+        
+        # Mock TabbedContent widget
+        mock_tabs = FakeTabs()
+        
+        with stub_ui(view) as ui:
+            ui.query_one.return_value = mock_tabs
+            
+            await view.show_workout_details(mock_workouts[0])
+            
+            # Verify state updates
+            assert view.selected_workout == mock_workouts[0]
+            assert view.workout_analyses == mock_workout_analyses
+            
+            # Verify service call
+            patched_service.get_workout_analyses.assert_called_once_with(1)
+            
+            # Verify UI updates
+            ui.refresh.assert_called()
+            assert mock_tabs.active == "workout-details-tab"
+            
+            # Verify message posting
+            ui.post_message.assert_called_once()
+
+    async def test_integration_full_workflow(self, mock_workouts, mock_sync_status, mock_workout_analyses, workout_view, patched_service):
+        """Test complete workflow integration."""
+        patched_service.get_workouts.return_value = mock_workouts
+        patched_service.get_sync_status.return_value = mock_sync_status
+        patched_service.get_workout_analyses.return_value = mock_workout_analyses
+        patched_service.analyze_workout.return_value = {
+            "status": "success",
+            "message": "Analysis completed"
+        }
+        
+        # Mock UI methods
+        with stub_ui(workout_view):
+            
+            # 1. Load initial data
+            result = await workout_view._load_workouts_data()
+            workouts, sync_status = result
+            workout_view.on_workouts_loaded((workouts, sync_status))
+            
+            # 2. Show workout details
+            await workout_view.show_workout_details(workouts[0])
+            
+            # 3. Analyze workout
+            await workout_view.analyze_selected_workout()
+            
+            # Verify full workflow executed
+            assert workout_view.workouts == mock_workouts
+            assert workout_view.sync_status == mock_sync_status
+            assert workout_view.selected_workout == mock_workouts[0]
+            assert workout_view.workout_analyses == mock_workout_analyses
+            assert workout_view.loading is False
+            assert workout_view.error_message is None
+
+
+class TestWorkoutMetricsChart:
+    """Test suite for the WorkoutMetricsChart widget."""
+
+    def test_chart_creation_with_data(self):
+        """Test ASCII chart generation with valid data."""
+        metrics_data = [
+            {"heart_rate": 150, "power": 200, "speed": 30},
+            {"heart_rate": 160, "power": 220, "speed": 32},
+        ]
+        chart = WorkoutMetricsChart(metrics_data)
+        
+        # Simple check to ensure it produces a Static widget with content
+        static_widget = chart.create_ascii_chart("Test", [10, 20])
+        assert isinstance(static_widget, Static)
+        assert "Min: 10.0" in str(static_widget.render())
+
+    def test_chart_creation_no_data(self):
+        """Test ASCII chart generation with no data."""
+        chart = WorkoutMetricsChart([])
+        static_widget = chart.create_ascii_chart("Test", [])
+        assert "No data" in str(static_widget.render())
+
+    def test_chart_text_is_cached_but_widgets_are_not(self):
+        """Test repeated charts reuse the cached text but get their own Static."""
+        WorkoutMetricsChart.clear_cache()
+        chart = WorkoutMetricsChart([])
+        first = chart.create_ascii_chart("Test", [10, 20])
+        second = chart.create_ascii_chart("Test", [10, 20])
+        assert first is not second
+        assert str(first.render()) == str(second.render())
+        assert WorkoutMetricsChart._chart_text.cache_info().hits == 1
+
+
+class TestWorkoutAnalysisPanel:
+    """Test suite for the WorkoutAnalysisPanel widget."""
+
+    def test_format_feedback(self):
+        """Test the formatting of feedback data."""
+        panel = WorkoutAnalysisPanel(workout_data={}, analyses=[])
+        feedback_dict = {"effort_level": "high", "pacing": "good"}
+        formatted = panel.format_feedback(feedback_dict)
+        assert "Effort Level: high" in formatted
+        assert "Pacing: good" in formatted
+
+    def test_format_suggestions(self):
+        """Test the formatting of suggestions data."""
+        panel = WorkoutAnalysisPanel(workout_data={}, analyses=[])
+        suggestions_dict = {"next_workout": "easy spin", "focus_on": "cadence"}
+        formatted = panel.format_suggestions(suggestions_dict)
+        assert "• Next Workout: easy spin" in formatted
+        assert "• Focus On: cadence" in formatted
+
+    @pytest.mark.asyncio
+    async def test_compose_with_analysis(self, mock_workout_analyses, mount):
+        """Test panel composition with existing analysis."""
+        panel = await mount(WorkoutAnalysisPanel(workout_data={}, analyses=mock_workout_analyses))
+        # Check that it creates a Collapsible widget when analysis is present
+        assert panel.query(Collapsible)
+
+    @pytest.mark.asyncio
+    async def test_compose_no_analysis(self, mount):
+        """Test panel composition without any analysis."""
+        panel = await mount(WorkoutAnalysisPanel(workout_data={}, analyses=[]))
+        # Check that it shows a "No analysis" message and an "Analyze" button
+        assert "No analysis available" in str(panel.query_one(Static).render())
+        assert panel.query_one("#analyze-workout-btn", Button)
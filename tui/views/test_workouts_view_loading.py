@@ -0,0 +1,165 @@
+"""
+Tests for WorkoutView data loading: fetching, timeouts and table population.
+"""
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from tui.views._fakes import FakeDataTable, stub_ui
+
+
+@pytest.mark.asyncio
+class TestWorkoutViewLoading:
+    """Test suite for loading and displaying workouts."""
+
+    async def test_workout_view_initialization(self, view):
+        """Test WorkoutView initializes with correct default state."""
+        assert view.workouts == []
+        assert view.selected_workout is None
+        assert view.workout_analyses == []
+        assert view.loading is True
+        assert view.sync_status == {}
+        assert view.error_message is None
+
+    async def test_load_workouts_data_success(self, mock_workouts, mock_sync_status, view, patched_service):
+        """Test successful loading of workouts data."""
+        patched_service.get_workouts.return_value = mock_workouts
+        patched_service.get_sync_status.return_value = mock_sync_status
+        
+        # Call the method
+        result = await view._load_workouts_data()
+        
+        # Verify results
+        workouts, sync_status = result
+        assert workouts == mock_workouts
+        assert sync_status == mock_sync_status
+        
+        # Verify service calls
+        patched_service.get_workouts.assert_called_once_with(limit=50)
+        patched_service.get_sync_status.assert_called_once()
+
+    async def test_load_workouts_data_database_error(self, workout_view):
+        """Test handling of database errors during workout loading."""
+        with patch('tui.views.workouts.AsyncSessionLocal') as mock_session_local:
+            # Setup mock to raise exception
+            mock_session_local.return_value.__aenter__.side_effect = Exception("Database connection failed")
+            
+            # Should raise the exception
+            with pytest.raises(Exception, match="Database connection failed"):
+                await workout_view._load_workouts_data()
+
+    async def test_load_workouts_with_timeout(self, mock_workouts, mock_sync_status, view):
+        """Test workout loading with timeout functionality."""
+        # Mock the actual loading method to return quickly
+        with patch.object(view, '_load_workouts_data') as mock_load:
+            mock_load.return_value = (mock_workouts, mock_sync_status)
+            
+            # Should complete successfully within timeout
+            result = await view._load_workouts_with_timeout()
+            workouts, sync_status = result
+            
+            assert workouts == mock_workouts
+            assert sync_status == mock_sync_status
+
+    async def test_load_workouts_timeout_error(self, view):
+        """Test timeout handling during workout loading."""
+        # Mock the actual loading method to hang until cancelled by the timeout
+        async def slow_load():
+            await asyncio.Event().wait()
+        
+        view.LOAD_TIMEOUT = 0.01
+
+        with patch.object(view, '_load_workouts_data', side_effect=slow_load):
+            with pytest.raises(Exception, match="timed out"):
+                await view._load_workouts_with_timeout()
+
+    async def test_on_workouts_loaded_success(self, mock_workouts, mock_sync_status, workout_view):
+        """Test successful handling of loaded workout data."""
+        workout_view.loading = True
+        workout_view.error_message = "Previous error"
+        
+        # Mock the UI update methods
+        with stub_ui(workout_view) as ui:
+            
+            # Call the method
+            workout_view.on_workouts_loaded((mock_workouts, mock_sync_status))
+            
+            # Verify state updates
+            assert workout_view.workouts == mock_workouts
+            assert workout_view.sync_status == mock_sync_status
+            assert workout_view.loading is False
+            assert workout_view.error_message is None
+            
+            # Verify UI method calls
+            ui.refresh.assert_called_once_with(layout=True)
+            ui.populate_workouts_table.assert_called_once()
+            ui.update_sync_status.assert_called_once()
+
+    async def test_on_workouts_loaded_error_handling(self, workout_view):
+        """Test error handling in on_workouts_loaded."""
+        workout_view.loading = True
+        
+        # Mock refresh to raise exception
+        with patch.object(workout_view, 'refresh', side_effect=Exception("UI Error")):
+            try:
+                # Should handle the exception gracefully
+                workout_view.on_workouts_loaded(([], {}))
+            except Exception:
+                # The exception is caught and handled inside the method
+                pass
+            
+            # Should still update loading state and set error
+            assert workout_view.loading is False
+            assert "Failed to process loaded data" in str(workout_view.error_message)
+
+    async def test_populate_workouts_table(self, mock_workouts, view):
+        """Test populating the workouts table with data."""
+        view.workouts = mock_workouts
+        
+        # Mock the DataTable widget
+        mock_table = FakeDataTable()
+        
+        with patch.object(view, 'query_one', return_value=mock_table):
+            await view.populate_workouts_table()
+            
+            # Verify table was cleared and populated
+            mock_table.clear.assert_called_once()
+            assert mock_table.add_row.call_count == len(mock_workouts)
+            
+            # Check first workout data formatting
+            first_call_args = mock_table.add_row.call_args_list[0][0]
+            assert "01/15 14:30" in first_call_args[0]
+            assert "cycling" in first_call_args[1]
+            assert "75min" in first_call_args[2]
+            assert "32.5km" in first_call_args[3]
+            assert "145 BPM" in first_call_args[4]
+            assert "180 W" in first_call_args[5]
+
+    async def test_populate_workouts_table_with_malformed_data(self, workout_view):
+        """Test populating the table with malformed or missing data."""
+        malformed_workouts = [
+            {
+                "id": 1,
+                "start_time": "Invalid-Date",
+                "duration_seconds": None,
+                "distance_m": "Not a number",
+                "avg_hr": None,
+                "avg_power": None
+            }
+        ]
+        workout_view.workouts = malformed_workouts
+        
+        mock_table = FakeDataTable()
+        
+        with patch.object(workout_view, 'query_one', return_value=mock_table):
+            await workout_view.populate_workouts_table()
+            
+            mock_table.clear.assert_called_once()
+            assert mock_table.add_row.call_count == 1
+            
+            # Check that it fell back to default/graceful values
+            call_args = mock_table.add_row.call_args[0]
+            assert "Invalid-Date" in call_args[0]  # Date fallback
+            assert "Unknown" in call_args[1]         # Activity type fallback
+            assert "N/A" in call_args[2]             # Duration fallback
+            assert "N/A" in call_args[3]             # Distance fallback
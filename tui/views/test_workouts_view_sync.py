@@ -0,0 +1,69 @@
+"""
+Tests for WorkoutView Garmin sync handling and sync status display.
+"""
+import pytest
+from unittest.mock import patch
+
+from tui.views._fakes import FakeStatic
+
+
+@pytest.mark.asyncio
+class TestWorkoutViewSync:
+    """Test suite for Garmin sync in the workout view."""
+
+    async def test_update_sync_status(self, mock_sync_status, view):
+        """Test updating sync status display."""
+        view.sync_status = mock_sync_status
+        
+        # Mock the Status widget
+        mock_status_text = FakeStatic()
+        
+        with patch.object(view, 'query_one', return_value=mock_status_text):
+            await view.update_sync_status()
+            
+            # Verify status text was updated
+            mock_status_text.update.assert_called_once()
+            update_text = mock_status_text.update.call_args[0][0]
+            
+            assert "Connected" in update_text
+            assert "2024-01-15 15:00" in update_text
+            assert "25" in update_text
+
+    async def test_sync_garmin_activities_success(self, workout_view, patched_service):
+        """Test successful Garmin sync operation."""
+        patched_service.sync_garmin_activities.return_value = {
+            "status": "success",
+            "activities_synced": 5,
+            "message": "Sync completed"
+        }
+        
+        # Mock the refresh methods
+        with patch.object(workout_view, 'check_sync_status') as mock_check_sync, \
+             patch.object(workout_view, 'refresh_workouts') as mock_refresh_workouts:
+            
+            await workout_view.sync_garmin_activities()
+            
+            # Verify service call
+            patched_service.sync_garmin_activities.assert_called_once_with(days_back=14)
+            
+            # Verify UI refresh calls
+            mock_check_sync.assert_called_once()
+            mock_refresh_workouts.assert_called_once()
+
+    async def test_sync_garmin_activities_failure(self, workout_view, patched_service):
+        """Test handling of Garmin sync failure."""
+        patched_service.sync_garmin_activities.return_value = {
+            "status": "error",
+            "activities_synced": 0,
+            "message": "Authentication failed"
+        }
+        
+        # Mock the refresh methods
+        with patch.object(workout_view, 'check_sync_status') as mock_check_sync, \
+             patch.object(workout_view, 'refresh_workouts') as mock_refresh_workouts:
+            
+            await workout_view.sync_garmin_activities()
+            
+            # Should still call refresh methods even on failure
+            mock_check_sync.assert_called_once()
+            mock_refresh_workouts.assert_called_once()
@@ -0,0 +1,107 @@
+"""
+Tests for WorkoutView event handling: buttons, row selection, watchers and compose.
+"""
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from textual.app import App
+from textual.widgets import Static, Button
+from tui.widgets.loading import LoadingSpinner
+
+from tui.views._fakes import FakeDataTable
+from tui.views.workouts import WorkoutView
+
+
+# Button.Pressed events for the view's buttons; the view only reads button.id
+_BUTTON_EVENTS = {
+    button_id: Button.Pressed(SimpleNamespace(id=button_id))
+    for button_id in (
+        "refresh-workouts-btn",
+        "sync-garmin-btn",
+        "check-sync-btn",
+        "retry-loading-btn",
+    )
+}
+
+
+@pytest.mark.asyncio
+class TestWorkoutViewUIEvents:
+    """Test suite for WorkoutView events and reactive updates."""
+
+    @pytest.mark.parametrize("attr,watcher,value", [
+        ("loading", "watch_loading", False),
+        ("error_message", "watch_error_message", "Test error"),
+    ])
+    async def test_watch_state_change(self, view, attr, watcher, value):
+        """Test reactive response to loading and error message changes."""
+        view._mounted = True
+        
+        with patch.object(view, 'refresh') as mock_refresh:
+            # Trigger the state change
+            setattr(view, attr, value)
+            getattr(view, watcher)(value)
+            
+            # Should trigger refresh
+            mock_refresh.assert_called()
+
+    @pytest.mark.parametrize("button_id,handler", [
+        ("refresh-workouts-btn", "refresh_workouts"),
+        ("sync-garmin-btn", "sync_garmin_activities"),
+        ("check-sync-btn", "check_sync_status"),
+        ("retry-loading-btn", "load_data"),
+    ])
+    async def test_button_pressed(self, workout_view, button_id, handler):
+        """Test each button press calls its handler."""
+        with patch.object(workout_view, handler) as mock_handler:
+            await workout_view.on_button_pressed(_BUTTON_EVENTS[button_id])
+            
+            mock_handler.assert_called_once()
+
+    async def test_button_pressed_retry_clears_error(self, workout_view):
+        """Test retry loading button press clears the previous error."""
+        workout_view.error_message = "Previous error"
+        
+        with patch.object(workout_view, 'load_data'):
+            await workout_view.on_button_pressed(_BUTTON_EVENTS["retry-loading-btn"])
+            
+            assert workout_view.error_message is None
+
+    async def test_data_table_row_selection(self, mock_workouts, view):
+        """Test row selection in workouts table."""
+        view.workouts = mock_workouts
+        
+        # Mock table and event
+        mock_table = FakeDataTable(id="workouts-table")
+        
+        # Mock event with row selection
+        event = MagicMock()
+        event.data_table = mock_table
+        event.cursor_row = 0
+        event.row_key = MagicMock()
+        event.row_key.value = 0
+        
+        with patch.object(view, 'show_workout_details') as mock_show_details:
+            await view.on_data_table_row_selected(event)
+            
+            # Should show details for first workout
+            mock_show_details.assert_called_once_with(mock_workouts[0])
+
+    async def test_compose_with_error(self):
+        """Test the compose method when an error message is set."""
+        class TestApp(App):
+            def compose(self):
+                workout_view = WorkoutView()
+                workout_view.error_message = "A critical error occurred"
+                workout_view.loading = False
+                yield workout_view
+
+        app = TestApp()
+        async with app.run_test() as pilot:
+            # Check for error display and retry button
+            assert any(
+                "A critical error occurred" in str(static.content)
+                for static in pilot.app.query(Static)
+            )
+            assert pilot.app.query_one("#retry-loading-btn", Button)
+            # Ensure loading spinner is not present
+            assert not pilot.app.query(LoadingSpinner)
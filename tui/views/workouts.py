@@ -4,6 +4,7 @@ Displays workout list, analysis, and import functionality.
 """
 import asyncio
 from datetime import datetime
+from functools import lru_cache
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, Vertical, ScrollableContainer
 from textual.widgets import (
@@ -13,14 +14,22 @@ from textual.widgets import (
 from textual.widget import Widget
 from textual.reactive import reactive
 from textual.message import Message
-import sys
-from typing import List, Dict, Optional
+from typing import Final, List, Dict, Optional, Tuple
 
 from backend.app.database import AsyncSessionLocal
 from tui.services.workout_service import WorkoutService
 from tui.widgets.loading import LoadingSpinner
 from tui.views.base_view import BaseView
 
+# Set to True to trace the workout load path in the Textual devtools log.
+_DEBUG: Final = False
+
+
+@lru_cache(maxsize=128)
+def _pretty_key(key: str) -> str:
+    """Display label for an analysis key, e.g. "next_workout" -> "Next Workout"."""
+    return key.replace('_', ' ').title()
+
 
 class WorkoutMetricsChart(Widget):
     """ASCII-based workout metrics visualization."""
@@ -55,27 +64,40 @@ class WorkoutMetricsChart(Widget):
     
     def create_ascii_chart(self, title: str, values: List[float], max_width: int = 50) -> Static:
         """Create a simple ASCII bar chart."""
+        # A fresh Static each time; only the chart text is shared.
+        return Static(self._chart_text(title, tuple(values)))
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _chart_text(title: str, values: Tuple[float, ...]) -> str:
+        """Chart text for a metric series, memoized on (title, values)."""
         if not values:
-            return Static(f"{title}: No data")
+            return f"{title}: No data"
         
         min_val = min(values)
         max_val = max(values)
         avg_val = sum(values) / len(values)
         
         # Create a simple representation
-        chart_text = f"{title}:\n"
-        chart_text += f"Min: {min_val:.1f} | Max: {max_val:.1f} | Avg: {avg_val:.1f}\n"
+        lines = [
+            f"{title}:",
+            f"Min: {min_val:.1f} | Max: {max_val:.1f} | Avg: {avg_val:.1f}",
+        ]
         
         # Simple histogram representation
         if max_val > min_val:
-            normalized = [(v - min_val) / (max_val - min_val) for v in values[:20]]  # Take first 20 points
-            chart_text += "["
-            for norm_val in normalized:
-                bar_length = int(norm_val * 10)
-                chart_text += "█" * bar_length + "░" * (10 - bar_length) + " "
-            chart_text += "]\n"
+            bars = []
+            for v in values[:20]:  # Take first 20 points
+                bar_length = int((v - min_val) / (max_val - min_val) * 10)
+                bars.append("█" * bar_length + "░" * (10 - bar_length) + " ")
+            lines.append("[" + "".join(bars) + "]")
         
-        return Static(chart_text)
+        return "\n".join(lines) + "\n"
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop the memoized chart text."""
+        cls._chart_text.cache_clear()
 
 
 class WorkoutAnalysisPanel(Widget):
@@ -131,24 +153,21 @@ class WorkoutAnalysisPanel(Widget):
         if isinstance(feedback, str):
             return feedback
         
-        formatted = []
-        for key, value in feedback.items():
-            formatted.append(f"{key.replace('_', ' ').title()}: {value}")
-        return "\n".join(formatted)
+        return "\n".join(f"{_pretty_key(key)}: {value}" for key, value in feedback.items())
     
     def format_suggestions(self, suggestions: Dict) -> str:
         """Format suggestions dictionary as readable text."""
         if isinstance(suggestions, str):
             return suggestions
         
-        formatted = []
-        for key, value in suggestions.items():
-            formatted.append(f"• {key.replace('_', ' ').title()}: {value}")
-        return "\n".join(formatted)
+        return "\n".join(f"• {_pretty_key(key)}: {value}" for key, value in suggestions.items())
 
 
 class WorkoutView(BaseView):
     """Workout management view."""
+
+    # Seconds to wait for the workout list before giving up
+    LOAD_TIMEOUT = 5.0
     
     # Reactive attributes
     workouts = reactive([])
@@ -157,6 +176,11 @@ class WorkoutView(BaseView):
     loading = reactive(True)
     sync_status = reactive({})
     error_message = reactive(None)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Analyses of the listed workouts, fetched in one query with the list
+        self._analyses_by_workout: Dict[int, List[Dict]] = {}
     
     DEFAULT_CSS = """
     .view-title {
@@ -217,8 +241,6 @@ class WorkoutView(BaseView):
     
     def compose(self) -> ComposeResult:
         """Create workout view layout."""
-        sys.stdout.write("WorkoutView.__init__: Instantiated\n")
-        sys.stdout.write("WorkoutView.compose: START\n")
         yield Static("Workout Management", classes="view-title")
         
         if self.error_message:
@@ -240,75 +262,59 @@ class WorkoutView(BaseView):
                         yield self.compose_workout_details()
                     else:
                         yield Static("Select a workout to view details", id="workout-details-placeholder")
-        sys.stdout.write("WorkoutView.compose: END\n")
 
     def on_mount(self) -> None:
         """Load workout data when mounted."""
-        sys.stdout.write("WorkoutView.on_mount: START\n")
         self.loading = True
-        sys.stdout.write("WorkoutView.on_mount: Calling load_data\n")
         self.load_data()
-        sys.stdout.write("WorkoutView.on_mount: END\n")
 
     async def _load_workouts_with_timeout(self) -> tuple[list, dict]:
-            """Load workouts with 5-second timeout."""
+            """Load workouts, giving up after LOAD_TIMEOUT seconds."""
             try:
                 # Wrap the actual loading with timeout
                 result = await asyncio.wait_for(
                     self._load_workouts_data(),
-                    timeout=5.0
+                    timeout=self.LOAD_TIMEOUT
                 )
                 return result
             except asyncio.TimeoutError:
-                raise Exception("Loading timed out after 5 seconds")
+                raise Exception(f"Loading timed out after {self.LOAD_TIMEOUT:g} seconds")
             except Exception as e:
                 raise e
     
     def load_data(self) -> None:
             """Public method to trigger data loading for the workout view."""
-            sys.stdout.write("WorkoutView.load_data: START\n")
             self.loading = True
-            sys.stdout.write("WorkoutView.load_data: Before run_async\n")
-            self.run_async(
-                self._async_wrapper(
-                    self._load_workouts_with_timeout(),
-                    self.on_workouts_loaded
-                )
-            )
-            sys.stdout.write("WorkoutView.load_data: After run_async - END\n")
+            self.run_async(self._load_workouts_with_timeout, self.on_workouts_loaded,
+                           key="workouts.load")
 
     async def _load_workouts_data(self) -> tuple[list, dict]:
         """Load workouts and sync status (async worker)."""
-        sys.stdout.write("WorkoutView._load_workouts_data: START\n")
-        self.log("Attempting to load workouts data...")
+        if _DEBUG:
+            self.log("Attempting to load workouts data...")
         try:
-            sys.stdout.write("WorkoutView._load_workouts_data: Before AsyncSessionLocal\n")
             async with AsyncSessionLocal() as db:
                 workout_service = WorkoutService(db)
-                sys.stdout.write("WorkoutView._load_workouts_data: Before get_workouts\n")
                 workouts = await workout_service.get_workouts(limit=50)
-                sys.stdout.write("WorkoutView._load_workouts_data: After get_workouts\n")
-                sys.stdout.write("WorkoutView._load_workouts_data: Before await get_sync_status\n")
                 sync_status = await workout_service.get_sync_status()
-                sys.stdout.write("WorkoutView._load_workouts_data: After await get_sync_status\n")
-                self.log(f"Workouts data loaded: {len(workouts)} workouts, sync status: {sync_status}")
-                sys.stdout.write("WorkoutView._load_workouts_data: Before return\n")
+                self._analyses_by_workout = await workout_service.get_analyses_for_workouts(
+                    [workout["id"] for workout in workouts]
+                )
+                if _DEBUG:
+                    self.log(f"Workouts data loaded: {len(workouts)} workouts, sync status: {sync_status}")
                 return workouts, sync_status
         except Exception as e:
-            sys.stdout.write(f"WorkoutView._load_workouts_data: ERROR: {str(e)}\n")
             self.log(f"Error loading workouts: {str(e)}", severity="error")
             raise
-        finally:
-            sys.stdout.write("WorkoutView._load_workouts_data: FINALLY\n")
 
     def on_workouts_loaded(self, result: tuple[list, dict]) -> None:
         """Handle loaded workout data."""
-        sys.stdout.write("WorkoutView.on_workouts_loaded: START\n")
-        self.log("Entering on_workouts_loaded")
+        if _DEBUG:
+            self.log("Entering on_workouts_loaded")
         try:
             workouts, sync_status = result
-            sys.stdout.write(f"WorkoutView.on_workouts_loaded: received: {len(workouts)} workouts, sync status: {sync_status}\n")
-            self.log(f"on_workouts_loaded received: {len(workouts)} workouts, sync status: {sync_status}")
+            if _DEBUG:
+                self.log(f"on_workouts_loaded received: {len(workouts)} workouts, sync status: {sync_status}")
             self.workouts = workouts
             self.sync_status = sync_status
             self.loading = False
@@ -316,15 +322,11 @@ class WorkoutView(BaseView):
             self.refresh(layout=True)
             self.populate_workouts_table()
             self.update_sync_status()
-            sys.stdout.write("WorkoutView.on_workouts_loaded: UI updated\n")
         except Exception as e:
-            sys.stdout.write(f"WorkoutView.on_workouts_loaded: ERROR: {e}\n")
             self.log(f"Error in on_workouts_loaded: {e}", severity="error")
             self.loading = False
             self.error_message = f"Failed to process loaded data: {str(e)}"
             self.refresh()
-        finally:
-            sys.stdout.write("WorkoutView.on_workouts_loaded: FINALLY\n")
 
     
     async def populate_workouts_table(self) -> None:
@@ -433,10 +435,13 @@ class WorkoutView(BaseView):
         try:
             self.selected_workout = workout
             
-            # Load analyses for this workout
-            async with AsyncSessionLocal() as db:
-                workout_service = WorkoutService(db)
-                self.workout_analyses = await workout_service.get_workout_analyses(workout["id"])
+            # Use the analyses loaded with the list; query only for workouts outside it
+            if workout["id"] in self._analyses_by_workout:
+                self.workout_analyses = self._analyses_by_workout[workout["id"]]
+            else:
+                async with AsyncSessionLocal() as db:
+                    workout_service = WorkoutService(db)
+                    self.workout_analyses = await workout_service.get_workout_analyses(workout["id"])
             
             # Refresh to show the details tab
             self.refresh()
@@ -506,6 +511,7 @@ class WorkoutView(BaseView):
                 
                 # Reload analyses for this workout
                 self.workout_analyses = await workout_service.get_workout_analyses(self.selected_workout["id"])
+                self._analyses_by_workout[self.selected_workout["id"]] = self.workout_analyses
                 self.refresh()
                 
                 # Post message that analysis was requested
@@ -526,6 +532,7 @@ class WorkoutView(BaseView):
                 # Reload analyses to update approval status
                 if self.selected_workout:
                     self.workout_analyses = await workout_service.get_workout_analyses(self.selected_workout["id"])
+                    self._analyses_by_workout[self.selected_workout["id"]] = self.workout_analyses
                     self.refresh()
                 
         except Exception as e:
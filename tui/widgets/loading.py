@@ -1,8 +1,9 @@
 """
 Loading spinner components for TUI.
 """
-from textual.widgets import Static
+from rich.console import RenderableType
 from rich.spinner import Spinner
+from textual.widgets import Static
 
 class LoadingSpinner(Static):
     """Animated loading spinner component."""
@@ -12,7 +13,9 @@ class LoadingSpinner(Static):
         self.spinner = Spinner(spinner, text=text)
         
     def on_mount(self) -> None:
-        self.set_interval(0.1, self.update_spinner)
+        # Repaint at the spinner's own frame rate; the frame drawn is picked
+        # from the clock at render time, so no per-tick update is needed.
+        self.auto_refresh = self.spinner.interval / 1000
         
-    def update_spinner(self) -> None:
-        self.update(self.spinner)
\ No newline at end of file
+    def render(self) -> RenderableType:
+        return self.spinner